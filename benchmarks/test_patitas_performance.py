@@ -17,6 +17,8 @@ Related:
     - bengal/parsing/backends/patitas/
 """
 
+import functools
+
 import pytest
 
 # Test documents with various Markdown features
@@ -169,16 +171,31 @@ $$
 ___
 """
 
+# Stress documents, built once at import instead of per fixture call
+LARGE_DOC = MEDIUM_DOC_WITH_TABLE * 10
+VERY_LARGE_DOC = MEDIUM_DOC_WITH_TABLE * 50
+
+# UTF-8 size of the baseline document, encoded once for throughput reporting
+MEDIUM_DOC_WITH_TABLE_BYTES = len(MEDIUM_DOC_WITH_TABLE.encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=4)
+def _get_parser(plugins: tuple[str, ...], highlight: bool):
+    """Return a memoized Patitas parser for the given (frozen) configuration.
+
+    Construction (plugin registration, regex compilation) is paid once, so
+    measurements only cover per-parse work. The parser is thread-safe, so
+    sharing the cached instance is fine.
+    """
+    from bengal.parsing.backends.patitas import create_markdown
+
+    return create_markdown(plugins=list(plugins), highlight=highlight)
+
 
 @pytest.fixture(scope="module")
 def patitas_parser():
     """Create Patitas parser instance."""
-    from bengal.parsing.backends.patitas import create_markdown
-
-    return create_markdown(
-        plugins=["table", "strikethrough", "math"],
-        highlight=False,
-    )
+    return _get_parser(("table", "strikethrough", "math"), False)
 
 
 # =============================================================================
@@ -233,7 +250,7 @@ class TestLargeDocument:
 
     @pytest.fixture
     def large_doc(self):
-        return MEDIUM_DOC_WITH_TABLE * 10
+        return LARGE_DOC
 
     def test_patitas_large(self, benchmark, patitas_parser, large_doc):
         """Patitas: Parse large document."""
@@ -251,7 +268,7 @@ class TestVeryLargeDocument:
 
     @pytest.fixture
     def very_large_doc(self):
-        return MEDIUM_DOC_WITH_TABLE * 50
+        return VERY_LARGE_DOC
 
     def test_patitas_very_large(self, benchmark, patitas_parser, very_large_doc):
         """Patitas: Parse very large document."""
@@ -273,24 +290,26 @@ class TestPerformanceBaseline:
 
     def test_patitas_throughput(self, patitas_parser):
         """Verify Patitas parsing throughput meets baseline."""
-        import time
+        import timeit
+
+        # Keep the baseline input ASCII-only: CPython then stores it at one
+        # byte per char, so chars/sec isn't skewed by a wider string layout
+        assert MEDIUM_DOC_WITH_TABLE.isascii()
 
         # Warm up
         for _ in range(5):
             patitas_parser(MEDIUM_DOC_WITH_TABLE)
 
-        # Benchmark
-        iterations = 100
-
-        start = time.perf_counter()
-        for _ in range(iterations):
-            patitas_parser(MEDIUM_DOC_WITH_TABLE)
-        total_time = time.perf_counter() - start
+        # Benchmark (autorange picks the iteration count; timeit's loop runs
+        # with GC disabled and minimal per-iteration overhead)
+        timer = timeit.Timer(lambda: patitas_parser(MEDIUM_DOC_WITH_TABLE))
+        iterations, total_time = timer.autorange()
 
         avg_time_ms = (total_time / iterations) * 1000
         chars_per_sec = len(MEDIUM_DOC_WITH_TABLE) * iterations / total_time
+        mb_per_sec = MEDIUM_DOC_WITH_TABLE_BYTES * iterations / total_time / 1e6
 
         print(f"\nPatitas performance ({iterations} iterations):")
         print(f"  Total time: {total_time * 1000:.2f}ms")
         print(f"  Avg per doc: {avg_time_ms:.3f}ms")
-        print(f"  Throughput: {chars_per_sec:,.0f} chars/sec")
+        print(f"  Throughput: {chars_per_sec:,.0f} chars/sec ({mb_per_sec:.2f} MB/s)")
@@ -48,7 +48,7 @@ class AssetReference:
     source_page: str  # Source page path that references this asset
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetDependencyEntry(CacheableMixin):
     """
     Cache entry for asset dependencies.
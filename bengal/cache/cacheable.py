@@ -9,7 +9,7 @@ For implementation details and documentation, see:
 - bengal/protocols/infrastructure.py: Canonical protocol definition
 
 Usage:
-    @dataclass
+    @dataclass(slots=True)
     class MyEntry(CacheableMixin):
         value: str
 
@@ -47,8 +47,14 @@ class CacheableMixin:
     Thread Safety:
         Delegates to to_cache_dict/from_cache_dict which must be thread-safe.
 
+    Memory:
+        Declares empty __slots__ so @dataclass(slots=True) subclasses keep a
+        slotted layout (no per-instance __dict__).
+
     """
 
+    __slots__ = ()
+
     def to_cache_dict(self) -> dict[str, Any]:
         """Serialize to cache-friendly dictionary (must be implemented by subclass)."""
         raise NotImplementedError
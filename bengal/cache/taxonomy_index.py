@@ -33,7 +33,7 @@ from bengal.utils.observability.logger import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TagEntry(CacheableMixin):
     """
     Entry for a single tag in the index.
@@ -14,75 +14,199 @@ from __future__ import annotations
 import re
 from re import Match
 
+# Structural tokens for the CSS walker. Comments and strings are matched as whole
+# tokens so braces inside them are never treated as structure.
+_CSS_TOKEN_RE = re.compile(
+    r"""/\*.*?(?:\*/|\Z)|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|[{}]""",
+    re.DOTALL,
+)
 
-def _find_balanced_braces(css: str, start: int) -> int | None:
+# Nested & selector up to its opening brace (run over an extracted rule selector)
+_NESTED_RE = re.compile(r"&\s*([:.#\[\w\s-]+)\s*\{")
+_TRIPLE_BLANK_RE = re.compile(r"\n\s*\n\s*\n")
+
+# Scoped h1 rule immediately followed by a bare h1 rule; groups 2 and 4 are
+# the rule bodies
+_DUP_H1_RE = re.compile(
+    r"(\.[\w-]+\s+h1\s*\{([^}]+)\})\s*(h1\s*\{([^}]+)\})", re.DOTALL
+)
+# Deletes all whitespace in one pass, for comparing rule bodies
+_WS_STRIP = str.maketrans("", "", " \n\t\r")
+
+# Deepest level of & nesting that gets expanded
+_MAX_NESTING_DEPTH = 10
+
+# (rule_start, open_pos, close_pos, children) - positions index into the CSS string
+type _CSSRule = tuple[int, int, int, list[_CSSRule]]
+
+
+def _extract_css_rules(css: str) -> list[_CSSRule]:
     """
-    Find the position of the closing brace that balances the opening brace at start.
+    Extract top-level CSS rules, with their nested rules, in a single pass.
+
+    Each rule is a (rule_start, open_pos, close_pos, children) tuple where
+    css[rule_start:open_pos] is the selector, css[open_pos + 1:close_pos] is
+    the block content, and children holds the directly nested rules.
+
+    Unclosed blocks are dropped, together with any rules nested inside them.
 
     Args:
         css: CSS content string
-        start: Position of the opening brace '{'
 
     Returns:
-        Position of the matching closing brace, or None if not found
+        List of top-level rules in document order
 
     """
-    if start >= len(css) or css[start] != "{":
-        return None
-
-    depth = 1
-    pos = start + 1
-    while pos < len(css) and depth > 0:
-        if css[pos] == "{":
-            depth += 1
-        elif css[pos] == "}":
-            depth -= 1
-        pos += 1
+    rules: list[_CSSRule] = []
+    # Open blocks: (rule_start, open_pos, children)
+    stack: list[tuple[int, int, list[_CSSRule]]] = []
+    # Bound methods hoisted out of the loop (runs once per brace)
+    rules_append = rules.append
+    push = stack.append
+    pop = stack.pop
+    rfind = css.rfind
+    # Top-level selectors span from the end of the previous rule, matching how
+    # they have always been sliced; nested selectors start after the previous
+    # declaration or rule. Declarations are only located (via rfind) when a
+    # nested block opens, so the walker never has to visit every ';'.
+    top_start = 0
+    statement_start = 0
+
+    # Only '{' and '}' tokens are structural; comment and string tokens fall
+    # through both branches, so braces inside them are ignored
+    for match in _CSS_TOKEN_RE.finditer(css):
+        token = match.group()
+        if token == "{":
+            pos = match.start()
+            if stack:
+                rule_start = rfind(";", statement_start, pos) + 1 or statement_start
+            else:
+                rule_start = top_start
+            push((rule_start, pos, []))
+            statement_start = pos + 1
+        elif token == "}":
+            pos = match.start()
+            if stack:
+                rule_start, open_pos, children = pop()
+                rule = (rule_start, open_pos, pos, children)
+                if stack:
+                    stack[-1][2].append(rule)
+                elif css[rule_start:open_pos].strip():  # Only add if there's a selector
+                    rules_append(rule)
+            if not stack:
+                top_start = pos + 1
+            statement_start = pos + 1
 
-    return pos - 1 if depth == 0 else None
+    return rules
 
 
-def _extract_css_rules(css: str) -> list[tuple[str, str, int, int]]:
+def _transform_rules(css: str, rules: list[_CSSRule], start: int, end: int) -> str:
     """
-    Extract CSS rules as (selector, block_content, start, end) tuples.
+    Rebuild css[start:end] with nesting expanded in the given sibling rules.
 
-    Uses iterative brace matching to avoid regex catastrophic backtracking.
+    Rules that need no change are copied through untouched.
+    """
+    new_parts: list[str] = []
+    last_end = start
 
-    Args:
-        css: CSS content string
+    for rule in rules:
+        rule_start, open_pos, close_pos, _ = rule
+        selector = css[rule_start:open_pos].strip()
+        if not selector:
+            continue
+        remaining, nested_rules = _transform_block(css, selector, rule, 0)
+
+        # Check if content was transformed (either nested rules extracted or content changed)
+        content_changed = remaining != css[open_pos + 1 : close_pos]
+        if nested_rules or content_changed:
+            # Add content before this rule
+            new_parts.append(css[last_end:rule_start])
+            # Add transformed rule
+            new_parts.append(f"{selector}{{{remaining}}}")
+            if nested_rules:
+                new_parts.append("\n")
+                new_parts.append("\n".join(nested_rules))
+            last_end = close_pos + 1
+        # If no changes, we'll include it unchanged via last_end tracking
+
+    if not new_parts:
+        return css[start:end]
+
+    # Add remaining content after last processed rule
+    new_parts.append(css[last_end:end])
+    return "".join(new_parts)
+
+
+def _transform_block(
+    css: str, selector: str, rule: _CSSRule, depth: int
+) -> tuple[str, list[str]]:
+    """
+    Transform a single CSS block, extracting nested rules.
 
-    Returns:
-        List of (selector, block_content, rule_start, rule_end) tuples
+    Nested & rules are expanded recursively, so deeper levels come out
+    right after the rule they were nested in.
 
+    Returns (remaining_content, list_of_extracted_rules).
     """
-    rules: list[tuple[str, str, int, int]] = []
-    pos = 0
+    _, open_pos, close_pos, children = rule
+    block_content = css[open_pos + 1 : close_pos]
 
-    while pos < len(css):
-        # Find next opening brace
-        brace_pos = css.find("{", pos)
-        if brace_pos == -1:
-            break
+    # For @layer blocks, transform the rules inside
+    if selector.startswith("@layer"):
+        if css.find("&", open_pos, close_pos) == -1:
+            return block_content, []
+        return _transform_rules(css, children, open_pos + 1, close_pos), []
+
+    # Skip other @rules (like @media, @keyframes, etc.)
+    if selector.startswith("@"):
+        return block_content, []
+
+    selector_clean = selector.strip()
+    if not selector_clean:
+        return block_content, []
+
+    nested_rules: list[str] = []
+    # Collect the kept slices of the block and join once at the end,
+    # instead of rebuilding the string for every extracted nested rule.
+    kept: list[str] = []
+    cursor = open_pos + 1
+
+    # Nested rules were already located by _extract_css_rules, so only
+    # each child's selector needs checking for a leading &
+    for child in children:
+        child_start, child_open, child_close, _ = child
+        match = _NESTED_RE.search(css, child_start, child_open + 1)
+        if not match:
+            continue
 
-        # Extract selector (text before the brace)
-        selector = css[pos:brace_pos].strip()
+        nested_selector_part = match.group(1).strip()
 
-        # Find matching closing brace
-        close_pos = _find_balanced_braces(css, brace_pos)
-        if close_pos is None:
-            # Unbalanced braces, skip this brace and continue
-            pos = brace_pos + 1
-            continue
+        # Build full selector
+        full_selector = selector_clean + nested_selector_part
 
-        # Extract block content (between braces)
-        block_content = css[brace_pos + 1 : close_pos]
+        # Expand the nested rule's own & rules; past the depth limit they are
+        # left in place as written
+        if depth + 1 < _MAX_NESTING_DEPTH:
+            nested_block, deeper_rules = _transform_block(
+                css, full_selector, child, depth + 1
+            )
+        else:
+            nested_block, deeper_rules = css[child_open + 1 : child_close], []
 
-        if selector:  # Only add if there's a selector
-            rules.append((selector, block_content, pos, close_pos + 1))
+        nested_rules.append(f"{full_selector} {{{nested_block}}}")
+        nested_rules.extend(deeper_rules)
 
-        pos = close_pos + 1
+        # Drop the nested rule by skipping over it
+        kept.append(css[cursor : match.start()])
+        cursor = child_close + 1
 
-    return rules
+    kept.append(css[cursor:close_pos])
+    remaining = "".join(kept)
+
+    # Clean up extra newlines
+    remaining = _TRIPLE_BLANK_RE.sub("\n\n", remaining)
+
+    return remaining, nested_rules
 
 
 def transform_css_nesting(css: str) -> str:
@@ -110,116 +234,12 @@ def transform_css_nesting(css: str) -> str:
         Transformed CSS with nesting syntax expanded
 
     """
-    # Pattern to find nested & selectors within a block
-    # This is safe because it only matches within already-extracted block content
-    nested_pattern = re.compile(r"&\s*([:.#\[\w\s-]+)\s*\{")
-
-    def transform_block(selector: str, block_content: str) -> tuple[str, list[str]]:
-        """
-        Transform a single CSS block, extracting nested rules.
-
-        Returns (remaining_content, list_of_extracted_rules).
-        """
-        # For @layer blocks, recursively transform the content inside
-        if selector.strip().startswith("@layer"):
-            # Recursively transform the content inside the @layer block
-            transformed_content = transform_css_nesting(block_content)
-            return transformed_content, []
-
-        # Skip other @rules (like @media, @keyframes, etc.)
-        if selector.strip().startswith("@"):
-            return block_content, []
+    # Most stylesheets have no nesting at all; skip parsing them entirely
+    if "&" not in css:
+        return css
 
-        # Clean @layer prefixes
-        selector_clean = re.sub(r"^@layer\s+\w+\s*", "", selector).strip()
-        has_layer = selector.strip().startswith("@layer")
-        layer_decl = ""
-        if has_layer:
-            layer_match = re.match(r"(@layer\s+\w+)\s*", selector)
-            if layer_match:
-                layer_decl = layer_match.group(1) + " "
-
-        if not selector_clean or selector_clean.startswith("@"):
-            return block_content, []
-
-        nested_rules: list[str] = []
-        remaining = block_content
-        search_start = 0
-
-        while True:
-            match = nested_pattern.search(remaining, search_start)
-            if not match:
-                break
-
-            # Find the opening brace position in remaining
-            brace_pos = match.end() - 1
-            close_pos = _find_balanced_braces(remaining, brace_pos)
-
-            if close_pos is None:
-                # Unbalanced, skip this match
-                search_start = match.end()
-                continue
-
-            nested_selector_part = match.group(1).strip()
-            nested_block = remaining[brace_pos + 1 : close_pos]
-
-            # Build full selector
-            if nested_selector_part.startswith((":", ".", "[", " ")):
-                full_selector = selector_clean + nested_selector_part
-            else:
-                full_selector = selector_clean + nested_selector_part
-
-            if has_layer:
-                nested_rules.append(f"{layer_decl}{full_selector} {{{nested_block}}}")
-            else:
-                nested_rules.append(f"{full_selector} {{{nested_block}}}")
-
-            # Remove the nested rule from remaining content
-            remaining = remaining[: match.start()] + remaining[close_pos + 1 :]
-            # Don't advance search_start since we removed content
-
-        # Clean up extra newlines
-        remaining = re.sub(r"\n\s*\n\s*\n", "\n\n", remaining)
-
-        return remaining, nested_rules
-
-    # Process iteratively to handle deeply nested cases
-    result = css
-    for _ in range(10):
-        rules = _extract_css_rules(result)
-        if not rules:
-            break
-
-        # Process rules in reverse order to preserve positions
-        new_parts: list[str] = []
-        last_end = 0
-        any_changes = False
-
-        for selector, block_content, rule_start, rule_end in rules:
-            remaining, nested_rules = transform_block(selector, block_content)
-
-            # Check if content was transformed (either nested rules extracted or content changed)
-            content_changed = remaining != block_content
-            if nested_rules or content_changed:
-                any_changes = True
-                # Add content before this rule
-                new_parts.append(result[last_end:rule_start])
-                # Add transformed rule
-                new_parts.append(f"{selector}{{{remaining}}}")
-                if nested_rules:
-                    new_parts.append("\n")
-                    new_parts.append("\n".join(nested_rules))
-                last_end = rule_end
-            # If no changes, we'll include it unchanged via last_end tracking
-
-        if not any_changes:
-            break
-
-        # Add remaining content after last processed rule
-        new_parts.append(result[last_end:])
-        result = "".join(new_parts)
-
-    return result
+    # One walk over the rule tree; nested rules are expanded recursively
+    return _transform_rules(css, _extract_css_rules(css), 0, len(css))
 
 
 def remove_duplicate_bare_h1_rules(css: str) -> str:
@@ -240,29 +260,17 @@ def remove_duplicate_bare_h1_rules(css: str) -> str:
         CSS with duplicate bare h1 rules removed
 
     """
-    # Pattern to match: scoped selector h1 { ... } followed by bare h1 { ... }
-    # We need to match the scoped rule, then check if there's a duplicate bare h1
-    pattern = r"(\.[\w-]+\s+h1\s*\{[^}]+\})\s*(h1\s*\{[^}]+\})"
+    if "h1" not in css:
+        return css
 
     def remove_duplicate(match: Match[str]) -> str:
-        scoped_rule = match.group(1)
-        bare_rule = match.group(2)
-
-        # Extract content from both rules
-        scoped_content_match = re.search(r"\{([^}]+)\}", scoped_rule, re.DOTALL)
-        bare_content_match = re.search(r"\{([^}]+)\}", bare_rule, re.DOTALL)
-
-        if scoped_content_match and bare_content_match:
-            scoped_content = (
-                scoped_content_match.group(1).strip().replace(" ", "").replace("\n", "")
-            )
-            bare_content = (
-                bare_content_match.group(1).strip().replace(" ", "").replace("\n", "")
-            )
+        # Rule bodies are captured by the pattern itself
+        scoped_content = match.group(2).translate(_WS_STRIP)
+        bare_content = match.group(4).translate(_WS_STRIP)
 
-            # If content is identical, remove the bare rule
-            if scoped_content == bare_content:
-                return scoped_rule  # Return only the scoped rule
+        # If content is identical, remove the bare rule
+        if scoped_content == bare_content:
+            return match.group(1)  # Return only the scoped rule
 
         # Not a duplicate, keep both
         return match.group(0)
@@ -270,7 +278,7 @@ def remove_duplicate_bare_h1_rules(css: str) -> str:
     # Process iteratively to catch all duplicates
     result = css
     for _ in range(5):  # Max 5 iterations
-        new_result = re.sub(pattern, remove_duplicate, result, flags=re.DOTALL)
+        new_result = _DUP_H1_RE.sub(remove_duplicate, result)
         if new_result == result:
             break
         result = new_result
@@ -34,7 +34,7 @@ from bengal.directives.base import BengalDirective
 from bengal.directives.include_utils import (
     load_file_content,
     parse_line_numbers,
-    resolve_include_path_with_fallback,
+    resolve_include_path_cached,
 )
 from bengal.utils.observability.logger import get_logger
 
@@ -111,27 +111,29 @@ class IncludeDirective(DirectivePlugin):
         options = dict(self.parse_options(m))
         start_line, end_line = parse_line_numbers(options)
 
-        # Resolve file path
-        file_path = resolve_include_path_with_fallback(path, state, "include")
+        # Resolve file path (cached across pages sharing a snippet)
+        resolved = resolve_include_path_cached(path, state, "include")
 
-        if not file_path:
+        if not resolved:
             return {
                 "type": "include",
                 "attrs": {"error": f"File not found: {path}"},
                 "children": [],
             }
+        file_path, canonical_path = resolved
 
         # --- Robustness: Check depth limit ---
-        # Use state.env dict for type-safe state tracking
+        # Use state.env dict for state tracking: mistune hands the same env
+        # dict to every child state, so includes nested in lists, quotes or
+        # other directives see the same depth and cycle set (attributes set
+        # on the state object itself would not propagate).
         # Note: Must check for None explicitly since empty dict {} is falsy
-        env_attr = getattr(state, "env", None)
-        if env_attr is None:
-            env: dict[str, object] = {}
-            state.env = env
-        else:
-            env = env_attr
-        depth_value = env.get("_include_depth", 0)
-        current_depth: int = depth_value if isinstance(depth_value, int) else 0
+        env: dict[str, object] | None = getattr(state, "env", None)
+        if env is None:
+            env = state.env = {}
+        current_depth = env.get("_include_depth", 0)
+        if not isinstance(current_depth, int):
+            current_depth = 0
         if current_depth >= MAX_INCLUDE_DEPTH:
             logger.warning(
                 "include_max_depth_exceeded",
@@ -149,12 +151,13 @@ class IncludeDirective(DirectivePlugin):
             }
 
         # --- Robustness: Check for include cycles ---
-        files_value = env.get("_included_files")
-        if isinstance(files_value, set):
-            included_files: set[str] = files_value  # type: ignore[assignment]
-        else:
+        # The set is stored once and mutated in place (add before parsing the
+        # included content, discard after), so it always holds exactly the
+        # files on the current include chain
+        included_files = env.get("_included_files")
+        if not isinstance(included_files, set):
             included_files = set()
-        canonical_path = str(file_path.resolve())
+            env["_included_files"] = included_files
         if canonical_path in included_files:
             logger.warning(
                 "include_cycle_detected",
@@ -181,17 +184,19 @@ class IncludeDirective(DirectivePlugin):
             }
 
         # --- Update state for nested includes ---
-        # Track this file to detect cycles using state.env dict
-        new_included_files = included_files | {canonical_path}
-        env["_included_files"] = new_included_files
+        # Track this file to detect cycles (O(1), no set copy per include)
+        included_files.add(canonical_path)
         env["_include_depth"] = current_depth + 1
 
-        # Parse included content as markdown
-        # Use parse_tokens to allow nested directives in included content
-        children = self.parse_tokens(block, content, state)
-
-        # Restore depth after parsing (allows sibling includes at same depth)
-        env["_include_depth"] = current_depth
+        try:
+            # Parse included content as markdown
+            # Use parse_tokens to allow nested directives in included content
+            children = self.parse_tokens(block, content, state)
+        finally:
+            # Restore state after parsing (allows sibling includes at the same
+            # depth, including repeated includes of the same file)
+            env["_include_depth"] = current_depth
+            included_files.discard(canonical_path)
 
         return {
             "type": "include",
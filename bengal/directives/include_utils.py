@@ -5,25 +5,35 @@ Provides common functionality for:
 - Path resolution with security checks
 - File loading with size limits and line range extraction
 - Line number parsing from directive options
+- File extension to code language mapping for literalinclude
+- Per-build caching of resolved paths and file contents
 """
 
 from __future__ import annotations
 
-import contextlib
+import itertools
+import os
+import stat
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from bengal.utils.concurrency.thread_local import ThreadSafeSet
 from bengal.utils.observability.logger import get_logger
+from bengal.utils.primitives.lru_cache import LRUCache
 
 if TYPE_CHECKING:
     from mistune.core import BlockState
 
 __all__ = [
+    "EXTENSION_LANGUAGE_MAP",
     "MAX_INCLUDE_SIZE",
+    "clear_include_caches",
     "extract_lines",
     "load_file_content",
     "parse_line_numbers",
     "resolve_include_path",
+    "resolve_include_path_cached",
 ]
 
 logger = get_logger(__name__)
@@ -31,6 +41,176 @@ logger = get_logger(__name__)
 # Robustness limits
 MAX_INCLUDE_SIZE = 10 * 1024 * 1024  # 10 MB - prevent memory exhaustion
 
+# File extension -> code block language for literalinclude (both backends)
+EXTENSION_LANGUAGE_MAP = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".html": "html",
+    ".css": "css",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+    ".toml": "toml",
+    ".md": "markdown",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".zsh": "bash",
+    ".fish": "bash",
+    ".rs": "rust",
+    ".go": "go",
+    ".java": "java",
+    ".cpp": "cpp",
+    ".c": "c",
+    ".h": "c",
+    ".hpp": "cpp",
+    ".rb": "ruby",
+    ".php": "php",
+    ".sql": "sql",
+    ".xml": "xml",
+    ".r": "r",
+    ".R": "r",
+    ".m": "matlab",
+    ".swift": "swift",
+    ".kt": "kotlin",
+    ".scala": "scala",
+    ".clj": "clojure",
+    ".hs": "haskell",
+    ".ml": "ocaml",
+    ".fs": "fsharp",
+    ".vb": "vbnet",
+    ".cs": "csharp",
+    ".dart": "dart",
+    ".lua": "lua",
+    ".pl": "perl",
+    ".pm": "perl",
+    ".vim": "vim",
+    ".vimrc": "vim",
+    ".dockerfile": "dockerfile",
+    ".makefile": "makefile",
+    ".mk": "makefile",
+}
+
+# Warning event names for the built-in directives, built once and interned
+_EVENT_NAMES: dict[tuple[str, str], str] = {
+    (directive, event): sys.intern(f"{directive}_{event}")
+    for directive in ("include", "literalinclude")
+    for event in (
+        "missing_root_path",
+        "absolute_path_rejected",
+        "path_traversal_rejected",
+        "symlink_rejected",
+        "outside_site_root",
+        "file_too_large",
+        "load_error",
+    )
+}
+
+# Whole files below this size are read with os.read, skipping the io stack
+_SMALL_INCLUDE_SIZE = 64 * 1024
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0)
+
+# Per-build caches so pages sharing a snippet resolve and read it once.
+# Thread-safe LRUCache (replaces @lru_cache for free-threading). All caches are
+# cleared at the start of every build.
+# (path, root_path, base_dir, fallback) -> (file_path, canonical_path)
+type _IncludePathKey = tuple[str, str, str | None, bool]
+_include_path_cache: LRUCache[_IncludePathKey, tuple[Path, str]] = LRUCache(
+    maxsize=512, name="include_paths"
+)
+# Failed lookups, so broken references don't re-probe every fallback on
+# every page that repeats them
+_missing_include_paths: LRUCache[_IncludePathKey, bool] = LRUCache(
+    maxsize=512, name="include_missing_paths"
+)
+# (file_path, mtime_ns, size, start_line, end_line) -> content
+_include_content_cache: LRUCache[tuple[str, int, int, int | None, int | None], str] = (
+    LRUCache(maxsize=256, name="include_content")
+)
+# Rejection warnings already logged this build, as "event\0path" keys. A broken
+# reference repeated across many pages warns once instead of once per page.
+_warned_rejections: ThreadSafeSet = ThreadSafeSet()
+# root_path -> realpath(root_path); the site root is stable for a whole build
+_resolved_root_cache: LRUCache[str, str] = LRUCache(
+    maxsize=64, name="include_resolved_roots"
+)
+
+
+def _event_name(directive_name: str, event: str) -> str:
+    """Return the log event name for a directive warning."""
+    name = _EVENT_NAMES.get((directive_name, event))
+    return name if name is not None else f"{directive_name}_{event}"
+
+
+def _warn_once(event: str, path: str, **context: str) -> None:
+    """Log a path rejection warning the first time it happens in a build."""
+    if _warned_rejections.add_if_new(f"{event}\0{path}"):
+        logger.warning(event, path=path, **context)
+
+
+def _resolved_root(root_path: str | Path) -> str:
+    """Return the real path of root_path, resolving each site root once per build."""
+    return _resolved_root_cache.get_or_set(
+        os.fspath(root_path), os.path.realpath, pass_key=True
+    )
+
+
+def _is_within(resolved_path: str, resolved_root: str) -> bool:
+    """
+    Check containment of one real path in another (string prefix, no I/O).
+
+    Equivalent to Path(resolved_path).relative_to(resolved_root) succeeding.
+    """
+    if resolved_path == resolved_root:
+        return True
+    prefix = resolved_root if resolved_root.endswith(os.sep) else resolved_root + os.sep
+    return resolved_path.startswith(prefix)
+
+
+def _lstat_once(path: str | Path) -> os.stat_result | None:
+    """
+    lstat a path once, so existence and symlink checks share one syscall.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        stat result (of the link itself for symlinks), or None if missing
+    """
+    try:
+        return os.lstat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _is_plain_file_entry(path: Path) -> bool:
+    """Return True if path exists and is not a symlink (one lstat call)."""
+    st = _lstat_once(path)
+    return st is not None and not stat.S_ISLNK(st.st_mode)
+
+
+def _read_small_file(file_path: Path, size: int) -> str:
+    """
+    Read and decode a small UTF-8 file without building a text file object.
+
+    Newlines are translated like open() in text mode, so the result matches
+    open(file_path, encoding="utf-8").read().
+    """
+    fd = os.open(file_path, _OPEN_FLAGS)
+    try:
+        # Read one byte past the stat size so a file that grew is not truncated
+        chunks = [os.read(fd, size + 1)]
+        while len(chunks[-1]) > size:
+            chunks.append(os.read(fd, _SMALL_INCLUDE_SIZE))
+            if not chunks[-1]:
+                break
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
 
 def parse_line_numbers(
     options: dict[str, str],
@@ -44,6 +224,10 @@ def parse_line_numbers(
     Returns:
         Tuple of (start_line, end_line), either may be None
     """
+    # Most includes have no line range
+    if "start-line" not in options and "end-line" not in options:
+        return None, None
+
     start_line_str = options.get("start-line")
     end_line_str = options.get("end-line")
 
@@ -51,11 +235,15 @@ def parse_line_numbers(
     end_line: int | None = None
 
     if start_line_str is not None:
-        with contextlib.suppress(ValueError, TypeError):
+        try:
             start_line = int(start_line_str)
+        except (ValueError, TypeError):
+            start_line = None
     if end_line_str is not None:
-        with contextlib.suppress(ValueError, TypeError):
+        try:
             end_line = int(end_line_str)
+        except (ValueError, TypeError):
+            end_line = None
 
     return start_line, end_line
 
@@ -88,64 +276,70 @@ def resolve_include_path(
     # Get root_path from state (MUST be set by rendering pipeline)
     root_path = getattr(state, "root_path", None)
     if not root_path:
-        logger.warning(
-            f"{directive_name}_missing_root_path",
-            path=path,
+        _warn_once(
+            _event_name(directive_name, "missing_root_path"),
+            path,
             action="skipping",
             hint="Ensure rendering pipeline passes root_path in state",
         )
         return None
-    root_path = Path(root_path)
+    # Path arithmetic stays on plain strings (os.path); a Path is only built
+    # for the return value
+    root_str = os.fspath(root_path)
 
     # Try to get source_path from state (current page being parsed)
     source_path = getattr(state, "source_path", None)
     if source_path:
-        source_path = Path(source_path)
-        base_dir = source_path.parent
+        base_dir = os.path.dirname(os.fspath(source_path))
     else:
-        content_dir = root_path / "content"
-        base_dir = content_dir if content_dir.exists() else root_path
+        content_dir = os.path.join(root_str, "content")
+        base_dir = content_dir if os.path.exists(content_dir) else root_str
 
     # Reject absolute paths (security)
-    if Path(path).is_absolute():
-        logger.warning(f"{directive_name}_absolute_path_rejected", path=path)
+    if os.path.isabs(path):
+        _warn_once(_event_name(directive_name, "absolute_path_rejected"), path)
         return None
 
     # Check for path traversal attempts
     normalized_path = path.replace("\\", "/")
     if "../" in normalized_path or normalized_path.startswith("../"):
-        resolved = (base_dir / path).resolve()
-        try:
-            resolved.relative_to(root_path.resolve())
-        except ValueError:
-            logger.warning(f"{directive_name}_path_traversal_rejected", path=path)
-            return None
-        file_path: Path | None = resolved
+        # Fast path: a lexically normalized path that stays under the root
+        # needs no realpath here (the containment check below still resolves
+        # symlinks); otherwise fall back to the resolved comparison, which
+        # also handles symlinked base directories
+        file_str = os.path.normpath(os.path.join(base_dir, path))
+        if not _is_within(file_str, os.path.normpath(root_str)):
+            file_str = os.path.realpath(file_str)
+            if not _is_within(file_str, _resolved_root(root_str)):
+                _warn_once(_event_name(directive_name, "path_traversal_rejected"), path)
+                return None
     else:
-        file_path = base_dir / path
+        file_str = os.path.join(base_dir, path)
 
-    # Check if file exists
-    if file_path is None or not file_path.exists():
-        file_path = None
+    # Check if file exists and reject symlinks, from a single lstat
+    st = _lstat_once(file_str)
+    if st is None:
+        return None
 
-    # Security: Reject symlinks
-    if file_path is not None and file_path.is_symlink():
-        logger.warning(
-            f"{directive_name}_symlink_rejected",
-            path=str(file_path),
+    # Security: Reject symlinks (dangling ones are simply not found)
+    if stat.S_ISLNK(st.st_mode):
+        if not os.path.exists(file_str):
+            return None
+        _warn_once(
+            _event_name(directive_name, "symlink_rejected"),
+            str(Path(file_str)),
             reason="symlinks_not_allowed_for_security",
         )
         return None
 
-    # Ensure file is within site root
-    if file_path is not None:
-        try:
-            file_path.resolve().relative_to(root_path.resolve())
-        except ValueError:
-            logger.warning(f"{directive_name}_outside_site_root", path=str(file_path))
-            return None
+    # Ensure file is within site root (realpath also catches symlinked parents)
+    if not _is_within(os.path.realpath(file_str), _resolved_root(root_str)):
+        _warn_once(
+            _event_name(directive_name, "outside_site_root"), str(Path(file_str))
+        )
+        return None
 
-    return file_path
+    return Path(file_str)
 
 
 def resolve_include_path_with_fallback(
@@ -177,46 +371,33 @@ def resolve_include_path_with_fallback(
     if not root_path:
         return None
     root_path = Path(root_path)
+    content_dir = root_path / "content"
 
     source_path = getattr(state, "source_path", None)
     if source_path:
-        source_path = Path(source_path)
-        base_dir = source_path.parent
+        base_dir = Path(source_path).parent
     else:
-        content_dir = root_path / "content"
         base_dir = content_dir if content_dir.exists() else root_path
 
+    add_md = not path.endswith(".md")
+    candidates: list[Path] = []
     # Try with .md extension
-    if not path.endswith(".md"):
-        md_path = base_dir / f"{path}.md"
-        if md_path.exists() and not md_path.is_symlink():
-            try:
-                md_path.resolve().relative_to(root_path.resolve())
-                return md_path
-            except ValueError:
-                pass
-
-    # Fallback: try content directory if file not found relative to page
+    if add_md:
+        candidates.append(base_dir / f"{path}.md")
+    # Fallback: try content directory if file not found relative to page (a
+    # missing content directory just fails the lstat)
     if source_path:
-        content_dir = root_path / "content"
-        if content_dir.exists():
-            fallback_path = content_dir / path
-            if fallback_path.exists() and not fallback_path.is_symlink():
-                try:
-                    fallback_path.resolve().relative_to(root_path.resolve())
-                    return fallback_path
-                except ValueError:
-                    pass
-
-            # Try with .md extension in content dir
-            if not path.endswith(".md"):
-                fallback_md = content_dir / f"{path}.md"
-                if fallback_md.exists() and not fallback_md.is_symlink():
-                    try:
-                        fallback_md.resolve().relative_to(root_path.resolve())
-                        return fallback_md
-                    except ValueError:
-                        pass
+        candidates.append(content_dir / path)
+        if add_md:
+            candidates.append(content_dir / f"{path}.md")
+
+    resolved_root = _resolved_root(root_path)
+    # Pages directly in content/ would probe the same .md candidate twice
+    for candidate in dict.fromkeys(candidates):
+        if _is_plain_file_entry(candidate) and _is_within(
+            os.path.realpath(candidate), resolved_root
+        ):
+            return candidate
 
     return None
 
@@ -235,16 +416,18 @@ def extract_lines(
         end_line: 1-indexed end line (None = to end)
 
     Returns:
-        Extracted lines
+        Extracted lines (the input list itself when the range covers it all)
     """
-    if start_line is not None or end_line is not None:
-        start = int(start_line) - 1 if start_line else 0
-        end = int(end_line) if end_line else len(lines)
-        # Clamp to valid range
-        start = max(0, min(start, len(lines)))
-        end = max(start, min(end, len(lines)))
-        return lines[start:end]
-    return lines
+    if start_line is None and end_line is None:
+        return lines
+    n = len(lines)
+    # Clamp to valid range
+    start = max(0, min(start_line - 1, n)) if start_line else 0
+    end = max(start, min(end_line, n)) if end_line else n
+    if start == 0 and end == n:
+        # Range covers every line; no copy needed
+        return lines
+    return lines[start:end]
 
 
 def load_file_content(
@@ -259,6 +442,10 @@ def load_file_content(
 
     Security: Enforces file size limit to prevent memory exhaustion.
 
+    Loaded content is cached per build, keyed on the file's mtime and size,
+    so a file included by many pages is read and decoded once while edited
+    files are re-read.
+
     Args:
         file_path: Path to file
         start_line: Optional start line (1-indexed)
@@ -271,10 +458,11 @@ def load_file_content(
     """
     try:
         # Check file size before reading (security)
-        file_size = file_path.stat().st_size
+        st = file_path.stat()
+        file_size = st.st_size
         if file_size > max_size:
             logger.warning(
-                f"{directive_name}_file_too_large",
+                _event_name(directive_name, "file_too_large"),
                 path=str(file_path),
                 size_bytes=file_size,
                 limit_bytes=max_size,
@@ -283,14 +471,105 @@ def load_file_content(
             )
             return None
 
-        with open(file_path, encoding="utf-8") as f:
-            lines = f.readlines()
-
-        lines = extract_lines(lines, start_line, end_line)
-        return "".join(lines).rstrip()
+        key = (str(file_path), st.st_mtime_ns, file_size, start_line, end_line)
+        cached = _include_content_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if start_line is None and end_line is None and file_size < _SMALL_INCLUDE_SIZE:
+            content = _read_small_file(file_path, file_size).rstrip()
+        else:
+            with open(file_path, encoding="utf-8") as f:
+                if start_line is None and end_line is None:
+                    content = f.read().rstrip()
+                else:
+                    # Stream only the requested window instead of reading every
+                    # line (same clamping as extract_lines)
+                    start = max(0, start_line - 1) if start_line else 0
+                    stop = max(start, end_line) if end_line else None
+                    content = "".join(itertools.islice(f, start, stop)).rstrip()
+
+        _include_content_cache.set(key, content)
+        return content
 
     except Exception as e:
         logger.warning(
-            f"{directive_name}_load_error", path=str(file_path), error=str(e)
+            _event_name(directive_name, "load_error"), path=str(file_path), error=str(e)
         )
         return None
+
+
+def resolve_include_path_cached(
+    path: str,
+    state: BlockState,
+    directive_name: str = "include",
+    fallback: bool = True,
+) -> tuple[Path, str] | None:
+    """
+    Resolve an include path, reusing earlier resolutions.
+
+    Results are shared by every page in the same directory, so a snippet
+    included across many pages only hits the filesystem once per build.
+    Failed lookups are remembered too (warnings are logged on the first miss).
+
+    Args:
+        path: Relative path to file
+        state: Parser state
+        directive_name: Name of directive for log messages
+        fallback: Use resolve_include_path_with_fallback (include) rather
+            than resolve_include_path (literalinclude)
+
+    Returns:
+        Tuple of (file_path, canonical_path), or None if not found
+    """
+    root_path = getattr(state, "root_path", None)
+    source_path = getattr(state, "source_path", None)
+    base_dir = str(Path(source_path).parent) if source_path else None
+    key = (path, str(root_path), base_dir, fallback)
+
+    cached = _include_path_cache.get(key)
+    if cached is not None:
+        return cached
+    if _missing_include_paths.get(key):
+        return None
+
+    if fallback:
+        file_path = resolve_include_path_with_fallback(path, state, directive_name)
+    else:
+        file_path = resolve_include_path(path, state, directive_name)
+    if file_path is None:
+        # Without a root_path nothing was probed; don't pin that result
+        if root_path:
+            _missing_include_paths.set(key, True)
+        return None
+
+    resolved = (file_path, str(file_path.resolve()))
+    _include_path_cache.set(key, resolved)
+    return resolved
+
+
+def clear_include_caches() -> None:
+    """Clear cached include resolutions, roots, contents and warnings (per build)."""
+    _include_path_cache.clear()
+    _missing_include_paths.clear()
+    _include_content_cache.clear()
+    _resolved_root_cache.clear()
+    _warned_rejections.clear()
+
+
+# Register at module import time so caches reset for every build and in tests
+try:
+    from bengal.utils.cache_registry import InvalidationReason, register_cache
+
+    register_cache(
+        "include_cache",
+        clear_include_caches,
+        invalidate_on={
+            InvalidationReason.BUILD_START,
+            InvalidationReason.FULL_REBUILD,
+            InvalidationReason.TEST_CLEANUP,
+        },
+    )
+except ImportError:
+    # Cache registry not available (shouldn't happen in normal usage)
+    pass
@@ -7,12 +7,12 @@ avoiding the pipe character collision issue in type annotations.
 
 from __future__ import annotations
 
-import re
 from re import Match
 from typing import Any, ClassVar
 
 from mistune.directives import DirectivePlugin
 
+from bengal.directives.list_table_utils import CELL_PREFIX, row_prefix_len
 from bengal.utils.observability.logger import get_logger
 
 __all__ = ["ListTableDirective", "render_list_table"]
@@ -124,15 +124,12 @@ class ListTableDirective(DirectivePlugin):
         current_row = []
         current_cell_lines: list[str] = []
 
-        lines = content.split("\n")
-        i = 0
-
-        while i < len(lines):
-            line = lines[i]
+        for line in content.split("\n"):
             stripped = line.strip()
 
             # Check for new row marker: "* -" at start
-            if re.match(r"^\*\s+-\s*", line):
+            row_prefix = row_prefix_len(line)
+            if row_prefix >= 0:
                 # Save previous cell and row if they exist
                 if current_cell_lines:
                     current_row.append("\n".join(current_cell_lines).strip())
@@ -142,18 +139,18 @@ class ListTableDirective(DirectivePlugin):
                     current_row = []
 
                 # Start new row with first cell
-                cell_content = re.sub(r"^\*\s+-\s*", "", line).strip()
+                cell_content = line[row_prefix:].strip()
                 current_cell_lines = [cell_content] if cell_content else []
 
             # Check for new cell marker: "  -" (2 spaces + dash)
-            elif re.match(r"^  -\s*", line):
+            elif line.startswith(CELL_PREFIX):
                 # Save previous cell
                 if current_cell_lines:
                     current_row.append("\n".join(current_cell_lines).strip())
                     current_cell_lines = []
 
                 # Start new cell
-                cell_content = re.sub(r"^  -\s*", "", line).strip()
+                cell_content = line[len(CELL_PREFIX) :].strip()
                 current_cell_lines = [cell_content] if cell_content else []
 
             # Blank line inside a cell - preserve for paragraph breaks
@@ -171,8 +168,6 @@ class ListTableDirective(DirectivePlugin):
 
             # Any other line - ignore (shouldn't happen in well-formed input)
 
-            i += 1
-
         # Save last cell and row
         if current_cell_lines:
             current_row.append("\n".join(current_cell_lines).strip())
@@ -283,17 +278,19 @@ def render_list_table(renderer: Any, text: str, **attrs: Any) -> str:
                     label_text = label_text[1:-1]
                 header_labels.append(label_text)
 
+        # Escape each column's label once, not once per body cell
+        data_label_attrs = [
+            f' data-label="{html_lib.escape(label, quote=True)}"'
+            for label in header_labels
+        ]
+        label_count = len(data_label_attrs)
+
         for row_idx in range(header_rows, len(rows)):
             html_parts.append("    <tr>")
             for col_idx, cell in enumerate(rows[row_idx]):
                 cell_html = render_cell(cell)
-                if header_labels and col_idx < len(header_labels):
-                    data_label = html_lib.escape(header_labels[col_idx], quote=True)
-                    html_parts.append(
-                        f'      <td data-label="{data_label}">{cell_html}</td>'
-                    )
-                else:
-                    html_parts.append(f"      <td>{cell_html}</td>")
+                attr = data_label_attrs[col_idx] if col_idx < label_count else ""
+                html_parts.append(f"      <td{attr}>{cell_html}</td>")
             html_parts.append("    </tr>")
         html_parts.append("  </tbody>")
 
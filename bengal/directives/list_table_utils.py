@@ -0,0 +1,30 @@
+"""
+Shared utilities for list-table directives.
+
+Both the mistune directive (``bengal.directives.list_table``) and the Patitas
+directive (``bengal.parsing.backends.patitas.directives.builtins.tables``)
+parse raw list-table content with these helpers, so the two backends split
+rows and cells the same way.
+"""
+
+from __future__ import annotations
+
+__all__ = ["CELL_PREFIX", "row_prefix_len"]
+
+# List markers: "* -" starts a row, "  -" (2 spaces + dash) starts a cell
+CELL_PREFIX = "  -"
+
+
+def row_prefix_len(line: str) -> int:
+    """
+    Return the length of a leading "* -" row marker, or -1 if there is none.
+
+    Matches ``*``, at least one whitespace character, then ``-``, using
+    plain string checks instead of a regex match per line.
+    """
+    if line[:1] != "*":
+        return -1
+    rest = line[1:].lstrip()
+    if rest[:1] != "-" or len(rest) == len(line) - 1:
+        return -1
+    return len(line) - len(rest) + 1
@@ -25,15 +25,16 @@ Robustness:
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from mistune.directives import DirectivePlugin
 
 from bengal.directives.include_utils import (
+    EXTENSION_LANGUAGE_MAP,
     load_file_content,
     parse_line_numbers,
-    resolve_include_path,
+    resolve_include_path_cached,
 )
 from bengal.utils.observability.logger import get_logger
 
@@ -115,15 +116,18 @@ class LiteralIncludeDirective(DirectivePlugin):
         if not language:
             language = self._detect_language(path)
 
-        # Resolve file path
-        file_path = resolve_include_path(path, state, "literalinclude")
+        # Resolve file path (cached across pages sharing an example file)
+        resolved = resolve_include_path_cached(
+            path, state, "literalinclude", fallback=False
+        )
 
-        if not file_path:
+        if not resolved:
             return {
                 "type": "literalinclude",
                 "attrs": {"error": f"File not found: {path}"},
                 "children": [],
             }
+        file_path, _canonical_path = resolved
 
         # Load file content
         content = load_file_content(file_path, start_line, end_line, "literalinclude")
@@ -159,57 +163,8 @@ class LiteralIncludeDirective(DirectivePlugin):
         Returns:
             Language name or None
         """
-        ext_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".html": "html",
-            ".css": "css",
-            ".yaml": "yaml",
-            ".yml": "yaml",
-            ".json": "json",
-            ".toml": "toml",
-            ".md": "markdown",
-            ".sh": "bash",
-            ".bash": "bash",
-            ".zsh": "bash",
-            ".fish": "bash",
-            ".rs": "rust",
-            ".go": "go",
-            ".java": "java",
-            ".cpp": "cpp",
-            ".c": "c",
-            ".h": "c",
-            ".hpp": "cpp",
-            ".rb": "ruby",
-            ".php": "php",
-            ".sql": "sql",
-            ".xml": "xml",
-            ".r": "r",
-            ".R": "r",
-            ".m": "matlab",
-            ".swift": "swift",
-            ".kt": "kotlin",
-            ".scala": "scala",
-            ".clj": "clojure",
-            ".hs": "haskell",
-            ".ml": "ocaml",
-            ".fs": "fsharp",
-            ".vb": "vbnet",
-            ".cs": "csharp",
-            ".dart": "dart",
-            ".lua": "lua",
-            ".pl": "perl",
-            ".pm": "perl",
-            ".vim": "vim",
-            ".vimrc": "vim",
-            ".dockerfile": "dockerfile",
-            ".makefile": "makefile",
-            ".mk": "makefile",
-        }
-
-        ext = Path(path).suffix.lower()
-        return ext_map.get(ext)
+        ext = os.path.splitext(path)[1].lower()
+        return EXTENSION_LANGUAGE_MAP.get(ext)
 
     def __call__(self, directive: Any, md: Any) -> None:
         """Register literalinclude directive."""
@@ -132,7 +132,7 @@ class ErrorSeverity(Enum):
         Returns:
             True for ERROR, WARNING, HINT. False only for FATAL.
         """
-        return self != ErrorSeverity.FATAL
+        return self in _CAN_CONTINUE
 
     @property
     def should_aggregate(self) -> bool:
@@ -144,10 +144,17 @@ class ErrorSeverity(Enum):
         Returns:
             True for ERROR and WARNING. False for FATAL and HINT.
         """
-        return self in (ErrorSeverity.ERROR, ErrorSeverity.WARNING)
+        return self in _SHOULD_AGGREGATE
 
 
-@dataclass
+# Severity flags, built once for the ErrorSeverity properties
+_CAN_CONTINUE = frozenset(
+    {ErrorSeverity.ERROR, ErrorSeverity.WARNING, ErrorSeverity.HINT}
+)
+_SHOULD_AGGREGATE = frozenset({ErrorSeverity.ERROR, ErrorSeverity.WARNING})
+
+
+@dataclass(slots=True)
 class RelatedFile:
     """
     A file related to an error for debugging context.
@@ -170,7 +177,7 @@ class RelatedFile:
         return f"{self.role}: {path_str}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorDebugPayload:
     """
     Machine-parseable debug context for AI troubleshooting.
@@ -15,7 +15,8 @@ Configuration Sources (in priority order)
    - ``BENGAL_TRACEBACK_MAX_FRAMES``: Maximum frames to display
    - ``BENGAL_TRACEBACK_SUPPRESS``: Comma-separated modules to suppress
 
-2. **Site Config File**: Via ``apply_file_traceback_to_env()``
+2. **Site Config File**: Via ``apply_file_traceback_to_env()``, or read
+   directly with ``TracebackConfig.from_mapping()``
 
    .. code-block:: yaml
 
@@ -73,6 +74,7 @@ from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
 from bengal.utils.observability.logger import get_logger
+from bengal.utils.primitives.lru_cache import LRUCache
 
 logger = get_logger(__name__)
 
@@ -86,12 +88,16 @@ class TracebackStyle(Enum):
 
 DEFAULT_SUPPRESS: tuple[str, ...] = ("click", "jinja2")
 
+_STYLE_VALUES = frozenset(s.value for s in TracebackStyle)
+
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
     from bengal.errors.traceback.renderer import TracebackRenderer
 
 
-@dataclass
+@dataclass(frozen=True)
 class TracebackConfig:
     """
     Configuration for traceback display and Rich installation.
@@ -99,6 +105,10 @@ class TracebackConfig:
     Controls how exceptions are rendered in Bengal CLI output. Can be
     loaded from environment variables via ``from_environment()``.
 
+    Frozen, because ``from_environment()`` and ``get_renderer()`` share
+    instances between callers; use ``dataclasses.replace()`` to derive a
+    modified config.
+
     Attributes:
         style: Traceback verbosity style (default: COMPACT).
         show_locals: Whether to show local variables in tracebacks
@@ -127,11 +137,76 @@ class TracebackConfig:
         """Load configuration from environment variables (MVP).
 
         Precedence: BENGAL_TRACEBACK → defaults.
+
+        The parsed config is cached against the raw env values, so repeated
+        calls only re-parse after one of the variables changes.
+        """
+        global _env_config
+        env = (
+            os.getenv("BENGAL_TRACEBACK"),
+            os.getenv("BENGAL_TRACEBACK_SHOW_LOCALS"),
+            os.getenv("BENGAL_TRACEBACK_MAX_FRAMES"),
+            os.getenv("BENGAL_TRACEBACK_SUPPRESS"),
+        )
+        cached = _env_config
+        if cached is not None and cached[0] == env:
+            return cached[1]
+
+        style_env, show_locals_env, max_frames_env, suppress_env = env
+
+        show_locals = (
+            None
+            if show_locals_env is None
+            else show_locals_env.strip() in {"1", "true", "True", "yes"}
+        )
+        max_frames: int | None = None
+        if max_frames_env:
+            with contextlib.suppress(ValueError):
+                max_frames = int(max_frames_env.strip())
+
+        suppress = suppress_env.split(",") if suppress_env else None
+
+        config = cls._from_values(style_env, show_locals, max_frames, suppress)
+        _env_config = (env, config)
+        return config
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[str, Any]) -> TracebackConfig:
+        """Build configuration from a ``dev.traceback`` config mapping.
+
+        Reads ``style``, ``show_locals``, ``max_frames`` and ``suppress``
+        directly, without going through environment variables. Missing or
+        invalid values fall back to the same defaults as
+        ``from_environment()``.
         """
-        style_env = (os.getenv("BENGAL_TRACEBACK") or "").strip().lower()
+        show_locals = bool(mapping["show_locals"]) if "show_locals" in mapping else None
+        max_frames: int | None = None
+        if "max_frames" in mapping:
+            with contextlib.suppress(Exception):
+                max_frames = int(mapping["max_frames"])
+
+        suppress_value = mapping.get("suppress")
+        suppress = (
+            [str(x) for x in suppress_value]
+            if isinstance(suppress_value, list | tuple)
+            else None
+        )
+
+        return cls._from_values(mapping.get("style"), show_locals, max_frames, suppress)
+
+    @classmethod
+    def _from_values(
+        cls,
+        style_value: object,
+        show_locals: bool | None,
+        max_frames: int | None,
+        suppress: Iterable[str] | None,
+    ) -> TracebackConfig:
+        """Apply style heuristics to already-parsed values (None = default)."""
+        style_name = str(style_value or "").strip().lower()
         style: TracebackStyle
-        if style_env in {s.value for s in TracebackStyle}:
-            style = TracebackStyle(style_env)
+        if style_name in _STYLE_VALUES:
+            style = TracebackStyle(style_name)
         else:
             # Default to compact - balances detail with readability
             style = TracebackStyle.COMPACT
@@ -147,36 +222,17 @@ class TracebackConfig:
             default_show_locals = False
             default_max_frames = 5
 
-        # Optional detailed overrides from env
-        show_locals_env = os.getenv("BENGAL_TRACEBACK_SHOW_LOCALS")
-        max_frames_env = os.getenv("BENGAL_TRACEBACK_MAX_FRAMES")
-        suppress_env = os.getenv("BENGAL_TRACEBACK_SUPPRESS")
-
-        show_locals = (
-            default_show_locals
-            if show_locals_env is None
-            else show_locals_env.strip() in {"1", "true", "True", "yes"}
-        )
-        try:
-            max_frames = (
-                default_max_frames
-                if not max_frames_env
-                else int(max_frames_env.strip())
-            )
-        except ValueError:
-            max_frames = default_max_frames
-
-        suppress: tuple[str, ...] = DEFAULT_SUPPRESS
-        if suppress_env:
-            parts = [p.strip() for p in suppress_env.split(",") if p.strip()]
+        suppress_modules: tuple[str, ...] = DEFAULT_SUPPRESS
+        if suppress is not None:
+            parts = tuple(p.strip() for p in suppress if p.strip())
             if parts:
-                suppress = tuple(parts)
+                suppress_modules = parts
 
         return cls(
             style=style,
-            show_locals=show_locals,
-            max_frames=max_frames,
-            suppress=suppress,
+            show_locals=default_show_locals if show_locals is None else show_locals,
+            max_frames=default_max_frames if max_frames is None else max_frames,
+            suppress=suppress_modules,
         )
 
     def install(self) -> None:
@@ -234,6 +290,15 @@ class TracebackConfig:
             return
 
     def get_renderer(self) -> TracebackRenderer:
+        """Return the renderer for this config's style.
+
+        Renderers only read their config, so one instance is shared per
+        distinct set of config values.
+        """
+        key = (self.style, self.show_locals, self.max_frames, self.suppress)
+        return _renderer_cache.get_or_set(key, self._create_renderer)
+
+    def _create_renderer(self) -> TracebackRenderer:
         from bengal.errors.traceback.renderer import (
             CompactTracebackRenderer,
             FullTracebackRenderer,
@@ -260,7 +325,7 @@ def set_effective_style_from_cli(style_value: str | None) -> None:
     if not style_value:
         return
     value = style_value.strip().lower()
-    if value in {s.value for s in TracebackStyle}:
+    if value in _STYLE_VALUES:
         os.environ["BENGAL_TRACEBACK"] = value
 
 
@@ -295,7 +360,7 @@ def apply_file_traceback_to_env(site_config: dict[str, Any] | None) -> None:
     # Style
     if os.getenv("BENGAL_TRACEBACK") is None:
         style = str(tb_cfg.get("style", "")).strip().lower()
-        if style in {s.value for s in TracebackStyle}:
+        if style in _STYLE_VALUES:
             os.environ["BENGAL_TRACEBACK"] = style
 
     # show_locals
@@ -316,3 +381,28 @@ def apply_file_traceback_to_env(site_config: dict[str, Any] | None) -> None:
         suppress = tb_cfg.get("suppress")
         if isinstance(suppress, list | tuple):
             os.environ["BENGAL_TRACEBACK_SUPPRESS"] = ",".join(str(x) for x in suppress)
+
+
+# Last config parsed by from_environment(), keyed by the raw env values
+_env_config: tuple[tuple[str | None, ...], TracebackConfig] | None = None
+
+# Shared renderers, keyed by (style, show_locals, max_frames, suppress)
+_renderer_cache: LRUCache[tuple[Any, ...], TracebackRenderer] = LRUCache(
+    maxsize=8, name="traceback_renderer"
+)
+
+
+def reset_traceback_config() -> None:
+    """Reset the cached environment config and renderers for test isolation."""
+    global _env_config
+    _env_config = None
+    _renderer_cache.clear()
+
+
+# Register with cache registry for automatic test cleanup
+try:
+    from bengal.utils.cache_registry import register_cache
+
+    register_cache("traceback_config", reset_traceback_config)
+except ImportError:
+    pass
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import contextlib
 from typing import TYPE_CHECKING, Any
 
 from bengal.health.base import BaseValidator
@@ -53,6 +52,10 @@ class TrackValidator(BaseValidator):
         if not tracks:
             return results
 
+        # Page lookup maps are built once; track items only need existence checks
+        maps = self._build_lookup_maps(site)
+        valid_keys = self._valid_item_keys(maps)
+
         # Validate track structure
         for track_id, track in tracks.items():
             if not isinstance(track, dict):
@@ -99,9 +102,12 @@ class TrackValidator(BaseValidator):
                     )
                     continue
 
-                # Use get_page logic to check if page exists
-                page = self._get_page(site, item_path)
-                if page is None:
+                # Same matches as get_page: relative path (with or without
+                # .md) or full source path
+                if (
+                    item_path not in valid_keys
+                    and item_path.replace("\\", "/") not in valid_keys
+                ):
                     missing_items.append(item_path)
 
             if missing_items:
@@ -148,63 +154,34 @@ class TrackValidator(BaseValidator):
 
         return results
 
-    def _get_page(self, site: SiteLike, path: str) -> object | None:
+    def _build_lookup_maps(self, site: SiteLike) -> dict[str, dict[str, object]]:
         """
-        Get page using same logic as get_page template function.
+        Get the site's page lookup maps, building them if needed.
 
-        This mirrors the logic in bengal.rendering.template_functions.get_page
-        to ensure validation matches runtime behavior.
+        Delegates to the get_page template function's builder, so validation
+        matches runtime behavior.
         """
-        if not path:
-            return None
+        from bengal.rendering.template_functions.get_page import _build_lookup_maps
 
-        # Build lookup maps if not already built
+        _build_lookup_maps(site)
         # Use getattr since _page_lookup_maps may not exist on SiteLike protocol
         page_lookup_maps = getattr(site, "_page_lookup_maps", None)
         if page_lookup_maps is None:
-            by_full_path: dict[str, object] = {}
-            by_content_relative: dict[str, object] = {}
-
-            content_root = site.root_path / "content"
-
-            for p in site.pages:
-                by_full_path[str(p.source_path)] = p
-
-                try:
-                    rel = p.source_path.relative_to(content_root)
-                    rel_str = str(rel).replace("\\", "/")
-                    by_content_relative[rel_str] = p
-                except ValueError:
-                    # Page is not under content root; skip adding to relative map.
-                    pass
-
-            page_lookup_maps = {
-                "full": by_full_path,
-                "relative": by_content_relative,
-            }
-            # Try to cache on site if possible
-            if hasattr(site, "_page_lookup_maps"):
-                with contextlib.suppress(AttributeError):
-                    site._page_lookup_maps = page_lookup_maps  # type: ignore[attr-defined]
-
-        maps = page_lookup_maps
-        normalized_path = path.replace("\\", "/")
-
-        # Strategy 1: Direct lookup
-        if normalized_path in maps["relative"]:
-            return maps["relative"][normalized_path]
-
-        # Strategy 2: Try adding .md extension
-        path_with_ext = (
-            f"{normalized_path}.md"
-            if not normalized_path.endswith(".md")
-            else normalized_path
-        )
-        if path_with_ext in maps["relative"]:
-            return maps["relative"][path_with_ext]
-
-        # Strategy 3: Try full path
-        if path in maps["full"]:
-            return maps["full"][path]
-
-        return None
+            return {"full": {}, "relative": {}}
+        return page_lookup_maps
+
+    @staticmethod
+    def _valid_item_keys(maps: dict[str, dict[str, object]]) -> set[str]:
+        """
+        Collect every track item path that get_page would resolve to a page.
+
+        Args:
+            maps: Lookup maps from _build_lookup_maps
+
+        Returns:
+            Relative paths, relative paths without .md, and full source paths
+        """
+        relative = maps["relative"]
+        valid_keys = set(relative) | set(maps["full"])
+        valid_keys.update(k[:-3] for k in relative if k.endswith(".md"))
+        return valid_keys
@@ -34,6 +34,7 @@ from typing import TYPE_CHECKING, ClassVar, Protocol
 from patitas.directives.options import DirectiveOptions
 from patitas.nodes import Directive
 
+from bengal.directives.include_utils import EXTENSION_LANGUAGE_MAP
 from bengal.parsing.backends.patitas.directives.contracts import DirectiveContract
 
 if TYPE_CHECKING:
@@ -209,57 +210,6 @@ class IncludeDirective:
 # =============================================================================
 
 
-# Extension to language mapping
-EXTENSION_LANGUAGE_MAP = {
-    ".py": "python",
-    ".js": "javascript",
-    ".ts": "typescript",
-    ".html": "html",
-    ".css": "css",
-    ".yaml": "yaml",
-    ".yml": "yaml",
-    ".json": "json",
-    ".toml": "toml",
-    ".md": "markdown",
-    ".sh": "bash",
-    ".bash": "bash",
-    ".zsh": "bash",
-    ".fish": "bash",
-    ".rs": "rust",
-    ".go": "go",
-    ".java": "java",
-    ".cpp": "cpp",
-    ".c": "c",
-    ".h": "c",
-    ".hpp": "cpp",
-    ".rb": "ruby",
-    ".php": "php",
-    ".sql": "sql",
-    ".xml": "xml",
-    ".r": "r",
-    ".R": "r",
-    ".m": "matlab",
-    ".swift": "swift",
-    ".kt": "kotlin",
-    ".scala": "scala",
-    ".clj": "clojure",
-    ".hs": "haskell",
-    ".ml": "ocaml",
-    ".fs": "fsharp",
-    ".vb": "vbnet",
-    ".cs": "csharp",
-    ".dart": "dart",
-    ".lua": "lua",
-    ".pl": "perl",
-    ".pm": "perl",
-    ".vim": "vim",
-    ".vimrc": "vim",
-    ".dockerfile": "dockerfile",
-    ".makefile": "makefile",
-    ".mk": "makefile",
-}
-
-
 @dataclass(frozen=True, slots=True)
 class LiteralIncludeOptions(DirectiveOptions):
     """Options for literalinclude directive."""
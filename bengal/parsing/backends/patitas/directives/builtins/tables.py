@@ -30,15 +30,27 @@ Matches Bengal's list-table directive exactly for parity.
 from __future__ import annotations
 
 import re
-from collections.abc import Sequence
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, replace
 from html import escape as html_escape
-from typing import TYPE_CHECKING, ClassVar
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from patitas.directives.options import DirectiveOptions
-from patitas.nodes import Directive
-
+from patitas.nodes import (
+    CodeSpan,
+    Directive,
+    Emphasis,
+    Link,
+    ListItem,
+    Strong,
+    Text,
+)
+from patitas.nodes import List as ListNode
+
+from bengal.directives.list_table_utils import CELL_PREFIX, row_prefix_len
 from bengal.parsing.backends.patitas.directives.contracts import DirectiveContract
+from bengal.utils.primitives.lru_cache import LRUCache
 
 if TYPE_CHECKING:
     from patitas.location import SourceLocation
@@ -47,6 +59,37 @@ if TYPE_CHECKING:
 
 __all__ = ["ListTableDirective"]
 
+# Fixed table markup, shared by every render
+_COLGROUP_OPEN = "  <colgroup>\n"
+_COLGROUP_CLOSE = "  </colgroup>\n"
+_THEAD_OPEN = "  <thead>\n"
+_THEAD_CLOSE = "  </thead>\n"
+_TBODY_OPEN = "  <tbody>\n"
+_TR_OPEN = "    <tr>\n"
+_TR_CLOSE = "    </tr>\n"
+_TABLE_CLOSE = "</table>"
+# Closing tags for a table with a body, written with one append
+_TBODY_TABLE_CLOSE = "  </tbody>\n</table>"
+# Rendering of a placeholder "-" cell
+_EMPTY_CELL_HTML = '<span class="table-empty">—</span>'
+
+# Inline markdown handled in cells, as one alternation:
+# `code` | **bold** | *italic* | [text](url)
+# Italic text may contain whole **bold** runs (*a **b** c*)
+_INLINE_RE = re.compile(
+    r"`([^`]+)`|\*\*([^*]+)\*\*|\*((?:[^*]|\*\*[^*]+\*\*)+)\*"
+    r"|\[([^\]]+)\]\(([^)]+)\)"
+)
+
+# Thread-safe cache of rendered cells (replaces @lru_cache for free-threading).
+# Short marked-up cells (`str | None`, **Yes**) repeat heavily across tables,
+# and the output only depends on the cell text. Cleared through the cache
+# registry (see the bottom of this module).
+_cell_html_cache: LRUCache[str, str] = LRUCache(maxsize=1024, name="list_table_cell")
+
+# Cells longer than this are rendered directly instead of being cached
+_CELL_CACHE_MAX_LEN = 128
+
 
 # =============================================================================
 # Typed Options
@@ -76,6 +119,10 @@ class ListTableOptions(DirectiveOptions):
     widths: str = ""
     css_class: str = ""
 
+    # Parsed form of widths, filled in by ListTableDirective.parse() (private
+    # fields are never read from the directive's raw options)
+    _column_widths: tuple[int, ...] = ()
+
 
 # =============================================================================
 # List Table Directive Handler
@@ -128,6 +175,10 @@ class ListTableDirective:
         location: SourceLocation,
     ) -> Directive:
         """Build list-table AST node."""
+        # Parse widths once here instead of on every render
+        if options.widths and not options._column_widths:
+            options = replace(options, _column_widths=_parse_widths(options.widths))
+
         return Directive(
             location=location,
             name=name,
@@ -147,24 +198,24 @@ class ListTableDirective:
         opts = node.options  # Direct typed access!
 
         header_rows = opts.header_rows
-        widths_str = opts.widths
-        widths: list[int] = []
-        if widths_str:
-            try:
-                widths = [int(w) for w in widths_str.split()]
-            except ValueError:
-                widths = []
+        widths = opts._column_widths
+        if not widths and opts.widths:
+            # Options that did not come through parse()
+            widths = _parse_widths(opts.widths)
 
         css_class = opts.css_class
 
-        # Parse the list content into rows
+        # Rows are streamed straight into the output; only the first row is
+        # pulled ahead, to check the table is non-empty before emitting markup
         # First try AST children (patitas parses content into List nodes)
-        rows = self._extract_rows_from_children(node.children)
+        rows: Iterator[list[str]] = self._iter_rows_from_children(node.children)
+        first_row = next(rows, None)
         # Fallback to raw_content parsing if no AST children
-        if not rows and node.raw_content:
-            rows = self._parse_list_rows(node.raw_content)
+        if first_row is None and node.raw_content:
+            rows = self._iter_list_rows(node.raw_content)
+            first_row = next(rows, None)
 
-        if not rows:
+        if first_row is None:
             sb.append(
                 '<div class="bengal-list-table-error">List table has no rows</div>'
             )
@@ -175,31 +226,33 @@ class ListTableDirective:
             f"bengal-list-table {css_class}" if css_class else "bengal-list-table"
         )
 
-        sb.append(f'<table class="{table_class}">\n')
+        # Build the whole table locally and hand it to the builder in one call
+        parts = [f'<table class="{table_class}">\n']
+        append = parts.append
+        render_cell = self._render_cell
 
         # Add colgroup if widths specified
         if widths:
-            sb.append("  <colgroup>\n")
-            for width in widths:
-                sb.append(f'    <col style="width: {width}%;">\n')
-            sb.append("  </colgroup>\n")
+            append(_COLGROUP_OPEN)
+            parts.extend(f'    <col style="width: {width}%;">\n' for width in widths)
+            append(_COLGROUP_CLOSE)
+
+        rows = chain((first_row,), rows)
 
         # Render header rows
         if header_rows > 0:
-            sb.append("  <thead>\n")
-            for row_idx in range(min(header_rows, len(rows))):
-                sb.append("    <tr>\n")
-                for cell in rows[row_idx]:
-                    cell_html = self._render_cell(cell)
-                    sb.append(f"      <th>{cell_html}</th>\n")
-                sb.append("    </tr>\n")
-            sb.append("  </thead>\n")
+            append(_THEAD_OPEN)
+            for header_row in islice(rows, header_rows):
+                append(_TR_OPEN)
+                for cell in header_row:
+                    append(f"      <th>{render_cell(cell)}</th>\n")
+                append(_TR_CLOSE)
+            append(_THEAD_CLOSE)
 
         # Extract header labels for data-label attributes (responsive tables)
         header_labels: list[str] = []
-        if header_rows > 0 and rows:
-            first_header = rows[0]
-            for header_cell in first_header:
+        if header_rows > 0:
+            for header_cell in first_row:
                 label_text = header_cell.strip()
                 # Remove surrounding backticks if present
                 if label_text.startswith("`") and label_text.endswith("`"):
@@ -207,26 +260,30 @@ class ListTableDirective:
                 header_labels.append(label_text)
 
         # Render body rows
-        if len(rows) > header_rows:
-            sb.append("  <tbody>\n")
-            for row_idx in range(header_rows, len(rows)):
-                sb.append("    <tr>\n")
-                for col_idx, cell in enumerate(rows[row_idx]):
-                    cell_html = self._render_cell(cell)
-                    if header_labels and col_idx < len(header_labels):
-                        data_label = html_escape(header_labels[col_idx])
-                        sb.append(
-                            f'      <td data-label="{data_label}">{cell_html}</td>\n'
-                        )
-                    else:
-                        sb.append(f"      <td>{cell_html}</td>\n")
-                sb.append("    </tr>\n")
-            sb.append("  </tbody>\n")
-
-        sb.append("</table>")
-
-    def _extract_rows_from_children(self, children: Sequence[Block]) -> list[list[str]]:
-        """Extract table rows from AST children (List nodes).
+        body_row = next(rows, None)
+        if body_row is not None:
+            # Escape each column's label once, not once per body cell
+            data_label_attrs = [
+                f' data-label="{html_escape(label)}"' for label in header_labels
+            ]
+            label_count = len(data_label_attrs)
+            append(_TBODY_OPEN)
+            for row in chain((body_row,), rows):
+                append(_TR_OPEN)
+                for col_idx, cell in enumerate(row):
+                    attr = data_label_attrs[col_idx] if col_idx < label_count else ""
+                    append(f"      <td{attr}>{render_cell(cell)}</td>\n")
+                append(_TR_CLOSE)
+            append(_TBODY_TABLE_CLOSE)
+        else:
+            append(_TABLE_CLOSE)
+
+        sb.append("".join(parts))
+
+    def _iter_rows_from_children(
+        self, children: Sequence[Block]
+    ) -> Iterator[list[str]]:
+        """Yield table rows from AST children (List nodes), one at a time.
 
         AST structure for list-table:
         - Directive
@@ -241,11 +298,6 @@ class ListTableDirective:
             - ListItem (row 2)
               ...
         """
-        from patitas.nodes import List as ListNode
-        from patitas.nodes import ListItem
-
-        rows: list[list[str]] = []
-
         for child in children:
             if not isinstance(child, ListNode):
                 continue
@@ -259,9 +311,7 @@ class ListTableDirective:
                 self._extract_cells_from_row(row_item, row)
 
                 if row:
-                    rows.append(row)
-
-        return rows
+                    yield row
 
     def _extract_cells_from_row(self, row_item: Block, row: list[str]) -> None:
         """Recursively extract cells from a row's ListItem.
@@ -271,9 +321,6 @@ class ListTableDirective:
         - Direct children (Paragraph) for the cell's text content
         - A nested List containing the remaining cells
         """
-        from patitas.nodes import List as ListNode
-        from patitas.nodes import ListItem
-
         if not hasattr(row_item, "children") or not row_item.children:
             return
 
@@ -286,9 +333,6 @@ class ListTableDirective:
 
     def _extract_cell_content(self, cell_item: Block, row: list[str]) -> None:
         """Extract content from a single cell ListItem."""
-        from patitas.nodes import List as ListNode
-        from patitas.nodes import ListItem
-
         if not hasattr(cell_item, "children") or not cell_item.children:
             return
 
@@ -317,69 +361,70 @@ class ListTableDirective:
                     self._extract_cell_content(nested_item, row)
 
     def _extract_text_from_node(self, node: Block) -> str:
-        """Extract text content from an AST node."""
-        from patitas.nodes import CodeSpan, Emphasis, Link, Strong, Text
-
-        parts: list[str] = []
+        """Extract text content from an AST node.
 
+        Walks the subtree with an explicit stack and joins once at the end.
+        Known inline nodes are dispatched on their exact type through
+        _TEXT_HANDLERS. Closing markers (``**``, ``*``, ``](url)``) are pushed
+        as plain strings beneath a node's children, so they are emitted after
+        them.
+        """
+        out: list[str] = []
+        stack: list[object] = []
         if hasattr(node, "children") and node.children:
-            for child in node.children:  # type: ignore[union-attr]
-                if isinstance(child, Text):
-                    parts.append(child.content)
-                elif isinstance(child, CodeSpan):
-                    parts.append(f"`{child.code}`")
-                elif isinstance(child, Strong):
-                    inner = self._extract_text_from_node(child)
-                    parts.append(f"**{inner}**")
-                elif isinstance(child, Emphasis):
-                    inner = self._extract_text_from_node(child)
-                    parts.append(f"*{inner}*")
-                elif isinstance(child, Link):
-                    inner = self._extract_text_from_node(child)
-                    parts.append(f"[{inner}]({child.destination})")
-                elif hasattr(child, "children"):
-                    parts.append(self._extract_text_from_node(child))
-                elif hasattr(child, "content"):
-                    parts.append(child.content)
-
-        return "".join(parts)
-
-    def _parse_list_rows(self, content: str) -> list[list[str]]:
+            stack.extend(reversed(node.children))  # type: ignore[union-attr]
+
+        while stack:
+            child = stack.pop()
+            handler = _TEXT_HANDLERS.get(type(child))
+            if handler is not None:
+                closing = handler(child, out)
+                if closing is None:
+                    continue
+                stack.append(closing)
+            elif not hasattr(child, "children"):
+                if hasattr(child, "content"):
+                    out.append(child.content)
+                continue
+
+            children = getattr(child, "children", None)
+            if children:
+                stack.extend(reversed(children))
+
+        return "".join(out)
+
+    def _iter_list_rows(self, content: str) -> Iterator[list[str]]:
         """Parse list content into table rows (fallback for raw content)."""
-        rows: list[list[str]] = []
         current_row: list[str] = []
         current_cell_lines: list[str] = []
 
-        lines = content.split("\n")
-        i = 0
-
-        while i < len(lines):
-            line = lines[i]
+        for line in content.split("\n"):
             stripped = line.strip()
 
             # Check for new row marker: "* -" at start
-            if re.match(r"^\*\s+-\s*", line):
+            row_prefix = row_prefix_len(line)
+            if row_prefix >= 0:
                 # Save previous cell and row if they exist
                 if current_cell_lines:
                     current_row.append("\n".join(current_cell_lines).strip())
                     current_cell_lines = []
                 if current_row:
-                    rows.append(current_row)
+                    yield current_row
                     current_row = []
 
                 # Start new row with first cell
-                cell_content = re.sub(r"^\*\s+-\s*", "", line).strip()
+                cell_content = line[row_prefix:].strip()
                 current_cell_lines = [cell_content] if cell_content else []
 
             # Check for new cell marker: "  -" (2 spaces + dash)
-            elif re.match(r"^  -\s*", line):
+            elif line.startswith(CELL_PREFIX):
                 # Save previous cell
                 if current_cell_lines:
                     current_row.append("\n".join(current_cell_lines).strip())
                     current_cell_lines = []
 
                 # Start new cell
-                cell_content = re.sub(r"^  -\s*", "", line).strip()
+                cell_content = line[len(CELL_PREFIX) :].strip()
                 current_cell_lines = [cell_content] if cell_content else []
 
             # Blank line inside a cell - preserve for paragraph breaks
@@ -395,35 +440,123 @@ class ListTableDirective:
             elif not stripped:
                 pass
 
-            i += 1
-
         # Save last cell and row
         if current_cell_lines:
             current_row.append("\n".join(current_cell_lines).strip())
         if current_row:
-            rows.append(current_row)
-
-        return rows
+            yield current_row
 
     def _render_cell(self, cell_content: str) -> str:
         """Render cell content with basic markdown support."""
-        # Normalize placeholder '-' which would otherwise render as an empty list
-        if cell_content.strip() == "-":
-            return '<span class="table-empty">—</span>'
+        # Most cells have no inline markup at all; they are only escaped,
+        # which is cheaper than the regex pass or a cache lookup
+        if (
+            "`" not in cell_content
+            and "*" not in cell_content
+            and "[" not in cell_content
+        ):
+            # Normalize placeholder '-' which would otherwise render as an empty list
+            if cell_content.strip() == "-":
+                return _EMPTY_CELL_HTML
+            return html_escape(cell_content)
+        # Only short marked-up cells go through the cache
+        if len(cell_content) > _CELL_CACHE_MAX_LEN:
+            return _render_cell_html(cell_content)
+        return _cell_html_cache.get_or_set(
+            cell_content, _render_cell_html, pass_key=True
+        )
+
+
+def _emit_str(node: str, out: list[str]) -> None:
+    out.append(node)
+
+
+def _emit_text(node: Text, out: list[str]) -> None:
+    out.append(node.content)
+
+
+def _emit_code_span(node: CodeSpan, out: list[str]) -> None:
+    out.append(f"`{node.code}`")
+
+
+def _open_strong(node: Strong, out: list[str]) -> str:
+    out.append("**")
+    return "**"
 
-        # For now, escape HTML and handle simple inline markdown
-        html = html_escape(cell_content)
 
-        # Handle inline code
-        html = re.sub(r"`([^`]+)`", r"<code>\1</code>", html)
+def _open_emphasis(node: Emphasis, out: list[str]) -> str:
+    out.append("*")
+    return "*"
 
-        # Handle bold
-        html = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>", html)
 
-        # Handle italic
-        html = re.sub(r"\*([^*]+)\*", r"<em>\1</em>", html)
+def _open_link(node: Link, out: list[str]) -> str:
+    out.append("[")
+    return f"]({node.destination})"
 
-        # Handle links
-        html = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r'<a href="\2">\1</a>', html)
 
-        return html
+# Text extraction per exact node type: each handler emits the node's text (or
+# opening marker) and returns the closing marker, or None if the node is a leaf.
+# Pending closing markers sit on the stack as plain strings.
+_TEXT_HANDLERS: dict[type, Callable[[Any, list[str]], str | None]] = {
+    str: _emit_str,
+    Text: _emit_text,
+    CodeSpan: _emit_code_span,
+    Strong: _open_strong,
+    Emphasis: _open_emphasis,
+    Link: _open_link,
+}
+
+
+def _render_cell_html(cell_content: str) -> str:
+    """Render one marked-up cell's markdown to HTML (pure, so results can be cached)."""
+    # Escape once up front; entities contain none of the markup characters,
+    # so the inline pattern matches the same spans afterwards
+    return _INLINE_RE.sub(_render_inline_match, html_escape(cell_content))
+
+
+def _parse_widths(widths: str) -> tuple[int, ...]:
+    """Parse the space-separated widths option; invalid input means no widths."""
+    try:
+        return tuple(int(w) for w in widths.split())
+    except ValueError:
+        return ()
+
+
+def _render_inline_match(match: re.Match[str]) -> str:
+    """
+    Render one inline markdown match from already-escaped cell text.
+
+    Code spans are literal; bold, italic and link text may contain further
+    inline markup and are rendered recursively.
+    """
+    code, bold, italic, link_text, href = match.groups()
+    if code is not None:
+        return f"<code>{code}</code>"
+    if bold is not None:
+        return f"<strong>{_INLINE_RE.sub(_render_inline_match, bold)}</strong>"
+    if italic is not None:
+        return f"<em>{_INLINE_RE.sub(_render_inline_match, italic)}</em>"
+    return f'<a href="{href}">{_INLINE_RE.sub(_render_inline_match, link_text)}</a>'
+
+
+def clear_list_table_cache() -> None:
+    """Clear the rendered-cell cache (per build and in tests)."""
+    _cell_html_cache.clear()
+
+
+# Register at module import time so the cache resets for every build and in tests
+try:
+    from bengal.utils.cache_registry import InvalidationReason, register_cache
+
+    register_cache(
+        "list_table_cell",
+        clear_list_table_cache,
+        invalidate_on={
+            InvalidationReason.BUILD_START,
+            InvalidationReason.FULL_REBUILD,
+            InvalidationReason.TEST_CLEANUP,
+        },
+    )
+except ImportError:
+    # Cache registry not available (shouldn't happen in normal usage)
+    pass
@@ -8,6 +8,7 @@ Thread-safe: all state is local to each render() call.
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING, Any
 
 from patitas.nodes import (
@@ -38,6 +39,9 @@ from bengal.parsing.backends.patitas.renderers.utils import (
 if TYPE_CHECKING:
     from bengal.parsing.backends.patitas.renderers.protocols import HtmlRendererProtocol
 
+# Line highlight spec in a fence info string (e.g., "python {1,3}")
+_HL_LINES_RE = re.compile(r"\{([^}]+)\}")
+
 
 class BlockRendererMixin:
     """Mixin providing block-level rendering methods.
@@ -384,9 +388,7 @@ class BlockRendererMixin:
 
         # Parse line highlights from info string (e.g., "python {1,3}" or "python {1-5}")
         hl_lines: set[int] | None = None
-        import re
-
-        hl_match = re.search(r"\{([^}]+)\}", info)
+        hl_match = _HL_LINES_RE.search(info) if "{" in info else None
         if hl_match:
             from bengal.rendering.highlighting.deferred import parse_hl_lines
 
@@ -6,9 +6,18 @@ Thread-safe: all functions are pure (no shared mutable state).
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from html import escape as html_escape
 
+# Characters that need percent-encoding in URLs: anything outside the safe set
+# (RFC 3986 unreserved + sub-delims + : / ? # @ = &; CommonMark allows more lax
+# URLs so we preserve more chars), plus a % that doesn't start a valid %XX
+# sequence. Runs of safe characters are skipped by the regex engine in C.
+_URL_UNSAFE_RE = re.compile(
+    r"%(?![0-9A-Fa-f]{2})|[^A-Za-z0-9\-._~:/?#\[\]@!$&'()*+,;=%]"
+)
+
 
 @dataclass(frozen=True, slots=True)
 class HeadingInfo:
@@ -64,39 +73,11 @@ def encode_url(url: str) -> str:
     # First, decode any HTML entities (e.g., &auml; → ä)
     decoded = html.unescape(url)
 
-    # Preserve already-valid percent sequences
-    # Split on existing %XX patterns and encode each part
-    result = []
-    i = 0
-    while i < len(decoded):
-        # Check for existing percent encoding
-        if decoded[i] == "%" and i + 2 < len(decoded):
-            hex_chars = decoded[i + 1 : i + 3]
-            if all(c in "0123456789ABCDEFabcdef" for c in hex_chars):
-                # Valid percent sequence - preserve it
-                result.append(decoded[i : i + 3])
-                i += 3
-                continue
-
-        char = decoded[i]
-
-        # Characters safe in URLs (RFC 3986 unreserved + sub-delims + : / ? # @ = &)
-        # CommonMark allows more lax URLs so we preserve more chars
-        if (
-            char
-            in "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~:/?#[]@!$&'()*+,;="
-        ):
-            result.append(char)
-        else:
-            # Percent-encode this character
-            encoded = quote(char, safe="")
-            result.append(encoded)
-
-        i += 1
+    # Percent-encode unsafe characters, preserving already-valid %XX sequences
+    url_encoded = _URL_UNSAFE_RE.sub(lambda m: quote(m.group(), safe=""), decoded)
 
     # Now HTML-escape the result for use in an attribute
     # This converts & → &amp;, etc.
-    url_encoded = "".join(result)
     return html_escape(url_encoded, quote=True)
 
 
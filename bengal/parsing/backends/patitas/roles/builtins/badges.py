@@ -78,6 +78,11 @@ class BadgeRole:
     )
     token_type: ClassVar[str] = "badge"
 
+    # Opening span per role name, built once (bdg -> secondary, bdg-x -> x)
+    _OPEN_SPANS: ClassVar[dict[str, str]] = {
+        name: f'<span class="badge badge-{name[4:] or "secondary"}">' for name in names
+    }
+
     def parse(
         self,
         name: str,
@@ -107,11 +112,7 @@ class BadgeRole:
             # Empty badges render nothing
             return
 
-        # Extract color from role name (bdg-primary -> primary)
         # Only registered names reach this handler (see `names` tuple)
-        name = node.name
-        color = "secondary" if name == "bdg" else name[4:]  # Remove "bdg-" prefix
-
-        sb.append(f'<span class="badge badge-{html_escape(color)}">')
+        sb.append(self._OPEN_SPANS[node.name])
         sb.append(html_escape(content))
         sb.append("</span>")
@@ -56,6 +56,7 @@ from bengal.rendering.engines.errors import (
     TemplateError,
     TemplateNotFoundError,
 )
+from bengal.rendering.engines.kida import KidaTemplateEngine
 from bengal.rendering.errors import TemplateRenderError
 
 if TYPE_CHECKING:
@@ -64,6 +65,23 @@ if TYPE_CHECKING:
 # Third-party engine registry (for plugins)
 _ENGINES: dict[str, type[TemplateEngine]] = {}
 
+# Sorted engine names for error messages; rebuilt after register_engine()
+_available_engines: tuple[str, ...] | None = None
+
+
+def reset_available_engines() -> None:
+    """Reset the cached engine name list for test isolation."""
+    global _available_engines
+    _available_engines = None
+
+
+def _get_available_engines() -> tuple[str, ...]:
+    global _available_engines
+    available = _available_engines
+    if available is None:
+        available = _available_engines = tuple(sorted({"kida", *_ENGINES}))
+    return available
+
 
 def register_engine(name: str, engine_class: type[TemplateEngine]) -> None:
     """
@@ -75,6 +93,7 @@ def register_engine(name: str, engine_class: type[TemplateEngine]) -> None:
 
     """
     _ENGINES[name] = engine_class
+    reset_available_engines()
 
 
 def create_engine(
@@ -100,22 +119,31 @@ def create_engine(
     """
     engine_name = site.config.get("template_engine", "kida")
 
+    # The built-in engine always wins over a registered engine of the same name
     if engine_name == "kida":
-        from bengal.rendering.engines.kida import KidaTemplateEngine
-
         return KidaTemplateEngine(site, profile=profile)
 
-    if engine_name in _ENGINES:
-        return _ENGINES[engine_name](site)
+    engine_class = _ENGINES.get(engine_name)
+    if engine_class is not None:
+        return engine_class(site)
 
-    available = ["kida", *_ENGINES.keys()]
     raise BengalConfigError(
-        f"Unknown template engine: '{engine_name}'. Available: {', '.join(sorted(available))}",
+        f"Unknown template engine: '{engine_name}'. "
+        f"Available: {', '.join(_get_available_engines())}",
         code=ErrorCode.C003,
         suggestion="Set template_engine to 'kida' (default) or register a custom engine",
     )
 
 
+# Register with cache registry for automatic test cleanup
+try:
+    from bengal.utils.cache_registry import register_cache
+
+    register_cache("available_engines", reset_available_engines)
+except ImportError:
+    pass
+
+
 # Public API
 __all__ = [
     # Protocol
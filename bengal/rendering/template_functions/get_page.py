@@ -12,6 +12,7 @@ reduces this to ~9 actual lookups with 45 cache hits.
 
 from __future__ import annotations
 
+import os
 import re
 import threading
 from pathlib import Path
@@ -32,6 +33,10 @@ logger = get_logger(__name__)
 # Cache is cleared at the start of each page render by clear_get_page_cache().
 _render_cache = threading.local()
 
+# Source paths from the filesystem only contain backslashes as separators on
+# Windows, so relative keys elsewhere are already in forward-slash form
+_BACKSLASH_SEP = os.sep == "\\"
+
 
 def _get_render_cache() -> dict[str, Page | None]:
     """
@@ -294,21 +299,23 @@ def _build_lookup_maps(site: SiteLike) -> None:
     by_full_path: dict[str, PageLike] = {}
     by_content_relative: dict[str, PageLike] = {}
 
-    content_root = site.root_path / "content"
+    # Relative keys are sliced off the source path string after this prefix,
+    # avoiding a PurePath.relative_to per page
+    content_prefix = str(site.root_path / "content") + os.sep
 
     for p in site.pages:
+        source_str = str(p.source_path)
+
         # Full path
-        by_full_path[str(p.source_path)] = p
+        by_full_path[source_str] = p
 
-        # Content relative
-        try:
-            rel = p.source_path.relative_to(content_root)
+        # Content relative (pages outside the content root are skipped)
+        if source_str.startswith(content_prefix):
+            rel_str = source_str[len(content_prefix) :]
             # Normalize path separators to forward slashes for consistent lookup
-            rel_str = str(rel).replace("\\", "/")
+            if _BACKSLASH_SEP:
+                rel_str = rel_str.replace("\\", "/")
             by_content_relative[rel_str] = p
-        except ValueError:
-            # Path not relative to content root (maybe outside?), skip
-            pass
 
     # Type narrowing: set attribute if site supports it
     if hasattr(site, "_page_lookup_maps"):
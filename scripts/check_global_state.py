@@ -19,8 +19,12 @@ Exit codes:
 
 from __future__ import annotations
 
+import ast
 import re
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
 
 # Patterns that indicate global state needing cleanup
@@ -31,6 +35,10 @@ GLOBAL_STATE_PATTERNS = [
     re.compile(r"^_[a-z_]+\s*(?::\s*\S+\s*)?=\s*(?:\{\}|\[\]|set\(\))\s*$"),
 ]
 
+# --all scans at least this many files in a process pool; below it, pool
+# startup costs more than it saves
+PARALLEL_MIN_FILES = 8
+
 # Files/patterns to exclude from checking
 EXCLUDE_PATTERNS = [
     "*/test_*.py",
@@ -52,6 +60,31 @@ SAFE_PATTERNS = [
     re.compile(r"^_invalidation_log\s*="),  # Cache registry internal state
 ]
 
+# SAFE_PATTERNS fused into one alternation, so a line costs a single match()
+_SAFE_RE = re.compile("|".join(f"(?:{p.pattern})" for p in SAFE_PATTERNS))
+
+
+def _line_pattern(pattern: re.Pattern[str]) -> str:
+    """Adapt a per-line pattern for scanning a whole file in MULTILINE mode."""
+    # Drop the anchors (the combined pattern supplies them) and keep
+    # whitespace matches from running onto the next line
+    return (
+        pattern.pattern.removeprefix("^").removesuffix("$").replace(r"\s", r"[^\S\n]")
+    )
+
+
+# Whole-file scanner: a line (after leading whitespace) that matches a global
+# state pattern and no safe pattern. Group 1 is the variable name. Matching
+# starts at the newline before each line, so the search can skip ahead by
+# literal prefix; the file is scanned as bytes (the patterns are ASCII), with
+# a newline prepended.
+_SAFE_LINE = "|".join(f"(?:{_line_pattern(p)})" for p in SAFE_PATTERNS)
+_GLOBAL_STATE_LINE = "|".join(f"(?:{_line_pattern(p)}$)" for p in GLOBAL_STATE_PATTERNS)
+_GLOBAL_STATE_LINE_RE = re.compile(
+    rf"\n[^\S\n]*(?!{_SAFE_LINE})(?={_GLOBAL_STATE_LINE})(_[a-z_]+)".encode(),
+    re.MULTILINE,
+)
+
 
 def is_excluded(path: Path) -> bool:
     """Check if path matches exclusion patterns."""
@@ -63,105 +96,192 @@ def is_excluded(path: Path) -> bool:
 
 def is_safe_pattern(line: str) -> bool:
     """Check if line matches a known safe pattern."""
-    return any(pattern.match(line) for pattern in SAFE_PATTERNS)
+    return _SAFE_RE.match(line) is not None
 
 
-def find_global_state(filepath: Path) -> list[tuple[int, str, str]]:
+def read_source(filepath: Path) -> bytes | None:
+    """Read a file's raw bytes, or None if it cannot be read."""
+    try:
+        return filepath.read_bytes()
+    except Exception:
+        return None
+
+
+def find_global_state(
+    filepath: Path, source: bytes | None = None
+) -> list[tuple[int, str, str]]:
     """
     Find potential global state in a Python file.
 
+    Args:
+        filepath: File to scan
+        source: The file's bytes, if already read
+
     Returns:
         List of (line_number, variable_name, line_content) tuples
     """
     issues = []
 
-    try:
-        content = filepath.read_text()
-        lines = content.splitlines()
-    except Exception:
-        return []
+    if source is None:
+        source = read_source(filepath)
+        if source is None:
+            return []
+
+    # One scan over the whole file; line numbers are counted incrementally
+    # between matches. With the newline prepended, a match's start in the
+    # scanned bytes is its line's start offset in source. Only matched lines
+    # are decoded.
+    line_num = 1
+    last_pos = 0
+    for match in _GLOBAL_STATE_LINE_RE.finditer(b"\n" + source):
+        line_start = match.start()
+        line_num += source.count(b"\n", last_pos, line_start)
+        last_pos = line_start
+        line_end = source.find(b"\n", line_start)
+        if line_end == -1:
+            line_end = len(source)
+        line = source[line_start:line_end].decode("utf-8", errors="replace")
+        issues.append((line_num, match.group(1).decode(), line.strip()))
+
+    return issues
 
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
 
-        # Skip comments and empty lines
-        if not stripped or stripped.startswith("#"):
-            continue
+def _is_empty_value(node: ast.expr | None) -> bool:
+    """Check if an assigned value is None or an empty dict/list/set()."""
+    if isinstance(node, ast.Constant):
+        return node.value is None
+    if isinstance(node, ast.Dict):
+        return not node.keys
+    if isinstance(node, ast.List):
+        return not node.elts
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "set"
+        and not node.args
+        and not node.keywords
+    )
 
-        # Skip safe patterns
-        if is_safe_pattern(stripped):
-            continue
 
-        # Check for global state patterns
-        for pattern in GLOBAL_STATE_PATTERNS:
-            if pattern.match(stripped):
-                # Extract variable name
-                match = re.match(r"^(_[a-z_]+)", stripped)
-                if match:
-                    var_name = match.group(1)
-                    issues.append((i, var_name, stripped))
-                break
+def _is_context_var(annotation: ast.expr) -> bool:
+    """Check if an annotation is ContextVar or ContextVar[...]."""
+    if isinstance(annotation, ast.Subscript):
+        annotation = annotation.value
+    return isinstance(annotation, ast.Name) and annotation.id == "ContextVar"
 
-    return issues
+
+def _names_reset_by(func: ast.FunctionDef | ast.AsyncFunctionDef) -> set[str]:
+    """
+    Find module globals a function resets.
+
+    A name counts when the function declares it ``global`` and assigns it:
+    to anything in a ``reset_*``/``clear_*`` function, otherwise only to
+    None or an empty collection.
+    """
+    declared: set[str] = set()
+    assigned: list[tuple[str, ast.expr | None]] = []
+    for node in ast.walk(func):
+        if isinstance(node, ast.Global):
+            declared.update(node.names)
+        elif isinstance(node, ast.Assign):
+            assigned.extend(
+                (target.id, node.value)
+                for target in node.targets
+                if isinstance(target, ast.Name)
+            )
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            assigned.append((node.target.id, node.value))
+
+    any_value = func.name.startswith(("reset_", "clear_"))
+    return {
+        name
+        for name, value in assigned
+        if name in declared and (any_value or _is_empty_value(value))
+    }
 
 
-def check_registration(filepath: Path, var_names: list[str]) -> list[str]:
+def _registered_names(tree: ast.Module) -> set[str]:
+    """
+    Collect names whose state is cleaned up somewhere in a module.
+
+    Covers globals reset inside functions, ``name.clear()`` and
+    ``obj.name.clear()`` calls, and ``name: ContextVar`` declarations
+    (context-local, nothing to reset).
+    """
+    registered: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            registered |= _names_reset_by(node)
+        elif isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Attribute) and func.attr == "clear":
+                receiver = func.value
+                if isinstance(receiver, ast.Name):
+                    registered.add(receiver.id)
+                elif isinstance(receiver, ast.Attribute):
+                    # cls._entries.clear() / self._entries.clear()
+                    registered.add(receiver.attr)
+        elif (
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Name)
+            and _is_context_var(node.annotation)
+        ):
+            registered.add(node.target.id)
+    return registered
+
+
+def check_registration(
+    filepath: Path, var_names: list[str], source: bytes | None = None
+) -> list[str]:
     """
     Check if global state variables are registered with cache registry.
 
+    The module is parsed once and walked for reset functions, ``.clear()``
+    calls and ContextVar declarations; files that cannot be read or parsed
+    report every variable as unregistered.
+
+    Args:
+        filepath: File to check
+        var_names: Global state variables found in the file
+        source: The file's bytes, if already read
+
     Returns:
         List of unregistered variable names
     """
+    if source is None:
+        source = read_source(filepath)
+        if source is None:
+            return var_names
+
     try:
-        content = filepath.read_text()
+        tree = ast.parse(source)
     except Exception:
         return var_names
 
-    # Check for reset functions that clear the variables
-    unregistered = []
-    for var_name in var_names:
-        # Look for patterns like:
-        # - global _var_name followed by _var_name = None
-        # - def reset_*() or def clear_*() that clears the variable
-        # - .clear() calls on the variable
-        reset_pattern = re.compile(
-            rf"def\s+(?:reset|clear)_\w+\([^)]*\).*?(?:global\s+{re.escape(var_name)}.*?{re.escape(var_name)}\s*=|{re.escape(var_name)}\.clear\(\))",
-            re.DOTALL,
-        )
-        clear_pattern = re.compile(
-            rf"global\s+{re.escape(var_name)}.*?{re.escape(var_name)}\s*=\s*(?:None|\[\]|set\(\)|\{{\}})",
-            re.DOTALL,
-        )
-        method_clear_pattern = re.compile(rf"{re.escape(var_name)}\.clear\(\)")
-
-        has_reset = (
-            reset_pattern.search(content)
-            or clear_pattern.search(content)
-            or method_clear_pattern.search(content)
-        )
-        is_context_var = f"{var_name}: ContextVar" in content
-        if not has_reset and not is_context_var:
-            unregistered.append(var_name)
-
-    return unregistered
+    registered = _registered_names(tree)
+    return [var_name for var_name in var_names if var_name not in registered]
 
 
 def check_file(filepath: Path) -> list[str]:
     """
     Check a single file for unregistered global state.
 
+    Exclusions are applied by the caller (see ``main``).
+
     Returns:
         List of error messages
     """
-    if is_excluded(filepath):
+    # Read once; both the scan and the registration check use these bytes
+    source = read_source(filepath)
+    if source is None:
         return []
 
-    issues = find_global_state(filepath)
+    issues = find_global_state(filepath, source)
     if not issues:
         return []
 
     var_names = [var_name for _, var_name, _ in issues]
-    unregistered = check_registration(filepath, var_names)
+    unregistered = check_registration(filepath, var_names, source)
 
     if not unregistered:
         return []
@@ -178,6 +298,23 @@ def check_file(filepath: Path) -> list[str]:
     return errors
 
 
+def report_errors(errors: Iterable[str]) -> int:
+    """
+    Print errors as they arrive, under a header printed before the first.
+
+    Returns:
+        Number of errors printed
+    """
+    count = 0
+    for error in errors:
+        if not count:
+            print("Unregistered global state detected (potential test pollution):\n")
+        print(error)
+        print()
+        count += 1
+    return count
+
+
 def main() -> int:
     """Main entry point."""
     args = sys.argv[1:]
@@ -186,24 +323,40 @@ def main() -> int:
         print(__doc__)
         return 0
 
-    if "--all" in args:
+    scan_all = "--all" in args
+    if scan_all:
         # Check all bengal/ Python files
         bengal_dir = Path(__file__).parent.parent / "bengal"
-        files = list(bengal_dir.rglob("*.py"))
+        candidates: Iterable[Path] = bengal_dir.rglob("*.py")
     else:
-        files = [Path(f) for f in args if f.endswith(".py")]
-
-    all_errors = []
-    for filepath in files:
-        if filepath.exists():
-            errors = check_file(filepath)
-            all_errors.extend(errors)
-
-    if all_errors:
-        print("Unregistered global state detected (potential test pollution):\n")
-        for error in all_errors:
-            print(error)
-            print()
+        candidates = (
+            filepath
+            for filepath in (Path(f) for f in args if f.endswith(".py"))
+            if filepath.exists()
+        )
+
+    # Filtered lazily, so checking starts while the tree is still being walked
+    files: Iterator[Path] = (
+        filepath for filepath in candidates if not is_excluded(filepath)
+    )
+
+    # Files are independent, so a full scan fans out across processes;
+    # pre-commit runs pass a handful of files and stay serial
+    parallel = False
+    if scan_all:
+        head = list(islice(files, PARALLEL_MIN_FILES))
+        parallel = len(head) == PARALLEL_MIN_FILES
+        files = chain(head, files)
+
+    if parallel:
+        with ProcessPoolExecutor() as executor:
+            error_count = report_errors(
+                chain.from_iterable(executor.map(check_file, files, chunksize=16))
+            )
+    else:
+        error_count = report_errors(chain.from_iterable(map(check_file, files)))
+
+    if error_count:
         print(
             "To fix: Add a reset function and register it with bengal.utils.cache_registry.\n"
             "See bengal/rendering/template_functions/authors.py for an example."
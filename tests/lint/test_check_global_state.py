@@ -0,0 +1,64 @@
+"""
+Tests for the global-state pre-commit hook (scripts/check_global_state.py).
+
+The hook is run as a subprocess on small modules, the same way pre-commit
+invokes it.
+
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "check_global_state.py"
+
+
+@pytest.fixture
+def module(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Module path outside the test_* directory that tmp_path would use.
+
+    The hook skips paths matching ``*/test_*.py``, which includes any file
+    under a ``test_<name>`` directory.
+    """
+    return tmp_path_factory.mktemp("hook") / "module.py"
+
+
+def run_hook(path: Path) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), str(path)],
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_unregistered_module_state_fails(module: Path) -> None:
+    module.write_text("_cache = {}\n")
+
+    result = run_hook(module)
+
+    assert result.returncode == 1
+    assert "Unregistered global state '_cache'" in result.stdout
+
+
+def test_attribute_clear_registers_class_state(module: Path) -> None:
+    module.write_text(
+        "class Registry:\n"
+        "    _entries = {}\n"
+        "\n"
+        "    @classmethod\n"
+        "    def reset(cls):\n"
+        "        cls._entries.clear()\n"
+        "\n"
+        "\n"
+        "class Other:\n"
+        "    _items = []\n"
+        "\n"
+        "    def clear_all(self):\n"
+        "        self._items.clear()\n"
+    )
+
+    result = run_hook(module)
+
+    assert result.returncode == 0, result.stdout
@@ -73,6 +73,18 @@ class TestTagEntry:
         assert entry.tag_slug == "python"
         assert len(entry.page_paths) == 2
 
+    def test_entry_has_no_instance_dict(self):
+        """Test entries use a slotted layout (CacheableMixin declares __slots__)."""
+        entry = TagEntry(
+            tag_slug="python",
+            tag_name="Python",
+            page_paths=[],
+            updated_at="2025-10-16T12:00:00",
+        )
+        assert not hasattr(entry, "__dict__")
+        entry.is_valid = False
+        assert entry.is_valid is False
+
 
 class TestTaxonomyIndex:
     """Tests for TaxonomyIndex."""
@@ -476,6 +476,48 @@ class TestCSSNestingTransformation:
         # Nesting should still be transformed
         assert ".button:hover" in transformed
 
+    def test_transforms_multi_level_nesting(self, temp_asset_dir):
+        """Test that nesting several levels deep is fully expanded."""
+        from bengal.core.asset import _transform_css_nesting
+
+        css = """
+.menu {
+    color: blue;
+    &.open {
+        display: block;
+        &:hover {
+            color: red;
+        }
+    }
+}
+"""
+
+        transformed = _transform_css_nesting(css)
+
+        assert ".menu.open" in transformed
+        assert ".menu.open:hover" in transformed
+        assert "&" not in transformed
+
+    def test_ignores_braces_in_comments_and_strings(self, temp_asset_dir):
+        """Test that braces inside comments and strings don't break nesting."""
+        from bengal.core.asset import _transform_css_nesting
+
+        css = """
+.icon {
+    /* { not a block */
+    content: "}";
+    &:hover {
+        color: red;
+    }
+}
+"""
+
+        transformed = _transform_css_nesting(css)
+
+        assert ".icon:hover" in transformed
+        assert "&:hover" not in transformed
+        assert 'content: "}";' in transformed
+
 
 class TestCSSMinifierUtility:
     """Test CSS minifier utility function.
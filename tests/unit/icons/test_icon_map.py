@@ -11,15 +11,14 @@ from bengal.icons import resolver as icon_resolver
 
 
 class TestIconMapValidity:
-    """Test that all ICON_MAP entries resolve to existing icons."""
+    """Test that all ICON_MAP entries resolve to existing icons.
+
+    The resolver starts each test uninitialized (default theme): the autouse
+    reset_bengal_state fixture clears it through the cache registry.
+    """
 
     def test_all_mapped_icons_exist(self) -> None:
         """Every icon in ICON_MAP should resolve to an actual SVG file."""
-        # Reset resolver to use default theme
-        icon_resolver._initialized = False
-        icon_resolver._search_paths = []
-        icon_resolver.clear_cache()
-
         missing = []
         for semantic_name, actual_name in ICON_MAP.items():
             svg = icon_resolver.load_icon(actual_name)
@@ -37,11 +36,6 @@ class TestIconMapValidity:
         Previously mapped to 'arrow-square-out' which didn't exist.
         Now correctly maps to 'external' which exists in default theme.
         """
-        # Reset resolver to use default theme
-        icon_resolver._initialized = False
-        icon_resolver._search_paths = []
-        icon_resolver.clear_cache()
-
         result = render_icon("external", size=16)
         assert result, "external icon should render"
         assert "<svg" in result, "should return valid SVG"
@@ -65,11 +59,6 @@ class TestIconMapValidity:
     )
     def test_common_semantic_icons_render(self, icon_name: str) -> None:
         """Common semantic icons used in templates should all render."""
-        # Reset resolver to use default theme
-        icon_resolver._initialized = False
-        icon_resolver._search_paths = []
-        icon_resolver.clear_cache()
-
         result = render_icon(icon_name, size=16)
         assert result, f"{icon_name} icon should render"
         assert "<svg" in result, f"{icon_name} should return valid SVG"
@@ -1,59 +1,74 @@
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 import pytest
 
 from bengal.core.site import Site
 from bengal.rendering.template_engine import TemplateEngine
 
+# Site and engine fixtures are module-scoped: tests only render from them, so
+# each config's Site and TemplateEngine are built once per module.
 
-@pytest.fixture
-def temp_site_dir():
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        site_dir = Path(tmp_dir) / "site"
-        site_dir.mkdir()
-        (site_dir / "bengal.toml").write_text(
-            """
+
+@pytest.fixture(scope="module")
+def temp_site_dir(tmp_path_factory):
+    site_dir = tmp_path_factory.mktemp("site")
+    (site_dir / "bengal.toml").write_text(
+        """
 [site]
 title = "Test Site"
 baseurl = ""
-            """
-        )
-        yield site_dir
+        """
+    )
+    return site_dir
 
 
-@pytest.fixture
-def temp_site_dir_with_favicon():
+@pytest.fixture(scope="module")
+def temp_site_dir_with_favicon(tmp_path_factory):
     """Site directory with custom favicon configured."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        site_dir = Path(tmp_dir) / "site"
-        site_dir.mkdir()
-        (site_dir / "bengal.toml").write_text(
-            """
+    site_dir = tmp_path_factory.mktemp("site_with_favicon")
+    (site_dir / "bengal.toml").write_text(
+        """
 [site]
 title = "Test Site"
 baseurl = ""
 favicon = "/assets/custom-favicon.png"
-            """
-        )
-        yield site_dir
+        """
+    )
+    return site_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def site_from_config(temp_site_dir):
     """Create a properly initialized Site using from_config()."""
     return Site.from_config(temp_site_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def site_with_favicon(temp_site_dir_with_favicon):
     """Create a Site with custom favicon configured."""
     return Site.from_config(temp_site_dir_with_favicon)
 
 
-def _create_mock_page(**kwargs: object) -> Mock:
-    """Create a Mock page with proper defaults for template rendering."""
+@pytest.fixture(scope="module")
+def engine(site_from_config):
+    """Template engine for the default-config site."""
+    return TemplateEngine(site_from_config)
+
+
+@pytest.fixture(scope="module")
+def engine_with_favicon(site_with_favicon):
+    """Template engine for the custom-favicon site."""
+    return TemplateEngine(site_with_favicon)
+
+
+def _create_mock_page(**kwargs: object) -> SimpleNamespace:
+    """
+    Create a stand-in page with proper defaults for template rendering.
+
+    A plain namespace rather than a Mock: attribute reads are ordinary
+    lookups, and attributes the template asks for but the page lacks
+    resolve as undefined instead of as truthy child Mocks.
+    """
     defaults: dict[str, object] = {
         "title": "Test Page",
         "url": "/",
@@ -62,20 +77,18 @@ def _create_mock_page(**kwargs: object) -> Mock:
         "kind": "page",
         "keywords": [],
         "tags": [],
-        "lang": None,  # Prevent Mock from being stringified in lang=""
+        "lang": None,
         "content": None,
         "date": None,
         "output_path": None,
         "metadata": {},
     }
     defaults.update(kwargs)
-    return Mock(**defaults)  # type: ignore[arg-type]
+    return SimpleNamespace(**defaults)
 
 
-def test_default_favicon_inclusion(site_from_config):
+def test_default_favicon_inclusion(site_from_config, engine):
     # Arrange: No favicon in config, use default theme
-    engine = TemplateEngine(site_from_config)
-
     # Mock a simple page context with proper defaults
     context = {
         "site": site_from_config,
@@ -93,10 +106,8 @@ def test_default_favicon_inclusion(site_from_config):
     assert "favicon-32x32.png" in html_output
 
 
-def test_custom_favicon_override(site_with_favicon):
+def test_custom_favicon_override(site_with_favicon, engine_with_favicon):
     # Arrange: Site with custom favicon configured in bengal.toml
-    engine = TemplateEngine(site_with_favicon)
-
     context = {
         "site": site_with_favicon,
         "page": _create_mock_page(),
@@ -104,7 +115,7 @@ def test_custom_favicon_override(site_with_favicon):
     }
 
     # Act
-    html_output = engine.render("base.html", context)
+    html_output = engine_with_favicon.render("base.html", context)
 
     # Assert: Custom favicon link is present
     assert "/assets/custom-favicon.png" in html_output
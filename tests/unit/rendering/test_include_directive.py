@@ -1,7 +1,7 @@
 """Tests for include directive."""
 
 import os
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -12,7 +12,9 @@ from bengal.directives.include import (
 )
 from bengal.directives.include_utils import (
     MAX_INCLUDE_SIZE,
+    clear_include_caches,
     load_file_content,
+    resolve_include_path_cached,
     resolve_include_path_with_fallback,
 )
 from bengal.parsing import PatitasParser
@@ -313,6 +315,24 @@ class TestIncludeDirective:
 
         assert content is None
 
+    def test_load_file_translates_newlines(self, temp_site_dir):
+        """Test Windows and old Mac line endings are read as \\n."""
+        file_path = temp_site_dir / "crlf.md"
+        file_path.write_bytes("Line 1\r\nLine 2\rLine 3 é\r\n".encode())
+
+        content = load_file_content(file_path, start_line=None, end_line=None)
+
+        assert content == "Line 1\nLine 2\nLine 3 é"
+
+    def test_load_file_invalid_utf8(self, temp_site_dir):
+        """Test loading a file that is not valid UTF-8."""
+        file_path = temp_site_dir / "binary.md"
+        file_path.write_bytes(b"\xff\xfe\x00")
+
+        content = load_file_content(file_path, start_line=None, end_line=None)
+
+        assert content is None
+
     def test_resolve_path_without_state_attributes(self, temp_site_dir):
         """Test path resolution when state has no root_path or source_path."""
 
@@ -557,39 +577,34 @@ class TestIncludeDirectiveRobustness:
         assert "error" not in result_a["attrs"]
         assert "error" not in result_b["attrs"]
 
-    def test_included_files_accumulate(self, temp_site_dir, mock_state_with_root):
-        """Test that included files are tracked across sibling includes."""
+    def test_included_files_tracked_during_parse(
+        self, temp_site_dir, mock_state_with_root
+    ):
+        """Test that the included file is tracked only while its content parses."""
         directive = IncludeDirective()
 
-        # Create two files
         snippets_dir = temp_site_dir / "content" / "snippets"
         snippets_dir.mkdir(parents=True, exist_ok=True)
         file_a = snippets_dir / "accum-a.md"
-        file_b = snippets_dir / "accum-b.md"
         file_a.write_text("Content A")
-        file_b.write_text("Content B")
+
+        seen: list[set[str]] = []
+
+        def capture(block, content, state):
+            seen.append(set(state.env["_included_files"]))
+            return []
 
         match = MagicMock()
         block = MagicMock()
-        directive.parse_tokens = MagicMock(return_value=[])
-
-        # Include file A
+        directive.parse_tokens = MagicMock(side_effect=capture)
         directive.parse_title = lambda m: "snippets/accum-a.md"
         directive.parse_options = lambda m: []
         directive.parse(block, match, mock_state_with_root)
 
-        # Verify file A is now in the included files set (tracked in state.env)
-        included_files = mock_state_with_root.env.get("_included_files", set())
-        assert str(file_a.resolve()) in included_files
-
-        # Include file B
-        directive.parse_title = lambda m: "snippets/accum-b.md"
-        directive.parse(block, match, mock_state_with_root)
-
-        # Verify both files are now tracked
-        included_files = mock_state_with_root.env.get("_included_files", set())
-        assert str(file_a.resolve()) in included_files
-        assert str(file_b.resolve()) in included_files
+        # Tracked while nested content parses (tracked in state.env)...
+        assert seen == [{str(file_a.resolve())}]
+        # ...and removed afterwards, so the set only holds the include chain
+        assert mock_state_with_root.env["_included_files"] == set()
 
     def test_max_depth_constant_is_reasonable(self):
         """Test that MAX_INCLUDE_DEPTH is set to a reasonable value."""
@@ -820,8 +835,15 @@ class TestIncludeStateIsolation:
         file_a.write_text("Content A")
         file_b.write_text("Content B")
 
+        # Snapshot each state's tracked files while its include is parsing
+        seen: dict[int, set[str]] = {}
+
+        def capture(block, content, state):
+            seen[id(state)] = set(state.env["_included_files"])
+            return []
+
         directive = IncludeDirective()
-        directive.parse_tokens = MagicMock(return_value=[])
+        directive.parse_tokens = MagicMock(side_effect=capture)
 
         match = MagicMock()
         block = MagicMock()
@@ -836,8 +858,8 @@ class TestIncludeStateIsolation:
         directive.parse(block, match, state2)
 
         # States should be independent
-        files1 = state1.env.get("_included_files", set())
-        files2 = state2.env.get("_included_files", set())
+        files1 = seen[id(state1)]
+        files2 = seen[id(state2)]
 
         # Each state should only have its own file
         assert len(files1) == 1
@@ -870,35 +892,148 @@ class TestIncludeStateIsolation:
         # Depth should be restored to original value
         assert mock_state_with_root.env["_include_depth"] == 5
 
-    def test_included_files_persist_across_siblings(
-        self, temp_site_dir, mock_state_with_root
-    ):
-        """Test that included files tracking persists across sibling includes."""
+    def test_same_file_included_by_siblings(self, temp_site_dir, mock_state_with_root):
+        """Test that including one file twice at the same level is not a cycle."""
         directive = IncludeDirective()
 
         snippets_dir = temp_site_dir / "content" / "snippets"
         snippets_dir.mkdir(parents=True, exist_ok=True)
-        file_a = snippets_dir / "persist-a.md"
-        file_b = snippets_dir / "persist-b.md"
-        file_a.write_text("A")
-        file_b.write_text("B")
+        (snippets_dir / "persist-a.md").write_text("A")
 
         match = MagicMock()
         block = MagicMock()
         directive.parse_tokens = MagicMock(return_value=[])
-
-        # Include A
         directive.parse_title = lambda m: "snippets/persist-a.md"
         directive.parse_options = lambda m: []
-        directive.parse(block, match, mock_state_with_root)
 
-        # Include B
-        directive.parse_title = lambda m: "snippets/persist-b.md"
-        directive.parse(block, match, mock_state_with_root)
+        first = directive.parse(block, match, mock_state_with_root)
+        second = directive.parse(block, match, mock_state_with_root)
+
+        assert "error" not in first["attrs"]
+        assert "error" not in second["attrs"]
+        assert mock_state_with_root.env["_included_files"] == set()
+
+    def test_state_restored_when_parsing_fails(
+        self, temp_site_dir, mock_state_with_root
+    ):
+        """Test that depth and tracked files are restored if parsing raises."""
+        directive = IncludeDirective()
+
+        snippets_dir = temp_site_dir / "content" / "snippets"
+        snippets_dir.mkdir(parents=True, exist_ok=True)
+        (snippets_dir / "boom.md").write_text("Content")
+
+        match = MagicMock()
+        block = MagicMock()
+        directive.parse_tokens = MagicMock(side_effect=RuntimeError("boom"))
+        directive.parse_title = lambda m: "snippets/boom.md"
+        directive.parse_options = lambda m: []
+
+        with pytest.raises(RuntimeError):
+            directive.parse(block, match, mock_state_with_root)
+
+        assert mock_state_with_root.env["_include_depth"] == 0
+        assert mock_state_with_root.env["_included_files"] == set()
+
+
+class TestIncludeCaching:
+    """Test per-build caching of include resolution and content."""
+
+    def test_resolution_is_cached(self, sample_markdown_file, mock_state_with_root):
+        """Test that repeated resolutions return the cached result."""
+        clear_include_caches()
+
+        first = resolve_include_path_cached("snippets/warning.md", mock_state_with_root)
+        second = resolve_include_path_cached(
+            "snippets/warning.md", mock_state_with_root
+        )
+
+        assert first is not None
+        assert first is second
+        file_path, canonical_path = first
+        assert file_path == sample_markdown_file
+        assert canonical_path == str(sample_markdown_file.resolve())
+
+    def test_missing_file_remembered_until_cleared(
+        self, temp_site_dir, mock_state_with_root
+    ):
+        """Test that failed lookups are cached until the next build clears them."""
+        clear_include_caches()
+
+        assert (
+            resolve_include_path_cached("snippets/later.md", mock_state_with_root)
+            is None
+        )
+
+        (temp_site_dir / "content" / "snippets" / "later.md").write_text("Later")
+
+        # Still a miss within the same build
+        assert (
+            resolve_include_path_cached("snippets/later.md", mock_state_with_root)
+            is None
+        )
+
+        clear_include_caches()
+
+        assert (
+            resolve_include_path_cached("snippets/later.md", mock_state_with_root)
+            is not None
+        )
+
+    def test_fallback_flag_is_part_of_key(self, temp_site_dir, mock_state_with_root):
+        """Test that literalinclude-style lookups skip the .md fallback."""
+        clear_include_caches()
+        (temp_site_dir / "content" / "snippets" / "noext.md").write_text("X")
+
+        assert resolve_include_path_cached("snippets/noext", mock_state_with_root)
+        assert (
+            resolve_include_path_cached(
+                "snippets/noext", mock_state_with_root, fallback=False
+            )
+            is None
+        )
+
+    def test_content_reloaded_when_file_changes(self, temp_site_dir):
+        """Test that cached content is invalidated by a newer mtime."""
+        clear_include_caches()
+        file_path = temp_site_dir / "content" / "snippets" / "changing.md"
+        file_path.write_text("Before")
+
+        assert load_file_content(file_path) == "Before"
+
+        file_path.write_text("After")
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_file_content(file_path) == "After"
+
+    def test_line_ranges_cached_separately(self, multi_line_markdown_file):
+        """Test that different line ranges of one file don't share an entry."""
+        clear_include_caches()
+
+        first = load_file_content(multi_line_markdown_file, start_line=1, end_line=2)
+        second = load_file_content(multi_line_markdown_file, start_line=3, end_line=4)
+
+        assert "Step 1" in first
+        assert "Step 3" not in first
+        assert "Step 3" in second
+        assert (
+            load_file_content(multi_line_markdown_file, start_line=1, end_line=2)
+            is first
+        )
+
+    def test_rejection_warned_once_per_build(self, mock_state_with_root):
+        """Test that a repeated rejected path only warns once per build."""
+        clear_include_caches()
+
+        with patch("bengal.directives.include_utils.logger") as mock_logger:
+            for _ in range(3):
+                resolve_include_path_with_fallback("/etc/passwd", mock_state_with_root)
+            assert mock_logger.warning.call_count == 1
+
+            resolve_include_path_with_fallback("/etc/hosts", mock_state_with_root)
+            assert mock_logger.warning.call_count == 2
 
-        # Both should be tracked
-        files = mock_state_with_root.env.get("_included_files", set())
-        assert len(files) == 2
-        paths_str = str(files)
-        assert "persist-a.md" in paths_str
-        assert "persist-b.md" in paths_str
+            clear_include_caches()
+            resolve_include_path_with_fallback("/etc/passwd", mock_state_with_root)
+            assert mock_logger.warning.call_count == 3
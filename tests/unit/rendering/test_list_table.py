@@ -100,6 +100,75 @@ class TestListTableDirective:
         assert "<code>code</code>" in html
         assert "<em>italic</em>" in html or "<i>italic</i>" in html
 
+    def test_list_table_code_spans_are_literal(self, parser):
+        """Test that emphasis markers inside code spans are left as written."""
+        markdown = """
+:::{list-table}
+:header-rows: 1
+
+* - Signature
+  - Notes
+* - `f(*args, **kwargs)`
+  - See [the **guide**](https://example.com)
+:::
+"""
+        html = parser.parse(markdown, {})
+
+        assert "<code>f(*args, **kwargs)</code>" in html
+        assert '<a href="https://example.com">the <strong>guide</strong></a>' in html
+
+    def test_list_table_bold_inside_italic(self, parser):
+        """Test that bold text nested in italic text renders inside the em."""
+        markdown = """
+:::{list-table}
+:header-rows: 1
+
+* - Name
+  - Notes
+* - foo
+  - *a **b** c*
+:::
+"""
+        html = parser.parse(markdown, {})
+
+        assert "<em>a <strong>b</strong> c</em>" in html
+
+    def test_list_table_repeated_cells(self, parser):
+        """Test that repeated marked-up cells render the same in every row."""
+        markdown = """
+:::{list-table}
+:header-rows: 1
+
+* - Name
+  - Type
+* - foo
+  - `str | None`
+* - bar
+  - `str | None`
+:::
+"""
+        html = parser.parse(markdown, {})
+
+        assert html.count('data-label="Type"><code>str | None</code></td>') == 2
+
+    def test_list_table_rerender_is_stable(self, parser):
+        """Test that rendering the same table again gives identical HTML."""
+        markdown = """
+:::{list-table}
+:header-rows: 1
+
+* - Name
+  - Type
+* - foo
+  - `int`
+:::
+"""
+        first = parser.parse(markdown, {})
+        second = parser.parse(markdown, {})
+
+        assert first == second
+        assert 'data-label="Type"><code>int</code></td>' in second
+
     def test_list_table_no_header(self, parser):
         """Test list-table without header rows."""
         markdown = """
@@ -1,5 +1,8 @@
+import dataclasses
 import os
 
+import pytest
+
 from bengal.errors.traceback import (
     TracebackConfig,
     TracebackStyle,
@@ -8,14 +11,22 @@ from bengal.errors.traceback import (
     set_effective_style_from_cli,
 )
 
+TRACEBACK_ENV_VARS = (
+    "BENGAL_TRACEBACK",
+    "BENGAL_TRACEBACK_SHOW_LOCALS",
+    "BENGAL_TRACEBACK_MAX_FRAMES",
+    "BENGAL_TRACEBACK_SUPPRESS",
+)
+
 
-def test_default_style_is_compact(monkeypatch):
-    # Clear traceback-related env vars (monkeypatch restores at teardown)
-    monkeypatch.delenv("BENGAL_TRACEBACK", raising=False)
-    monkeypatch.delenv("BENGAL_TRACEBACK_SHOW_LOCALS", raising=False)
-    monkeypatch.delenv("BENGAL_TRACEBACK_MAX_FRAMES", raising=False)
-    monkeypatch.delenv("BENGAL_TRACEBACK_SUPPRESS", raising=False)
+@pytest.fixture(autouse=True)
+def _clean_traceback_env(monkeypatch):
+    """Start each test with no traceback env vars (restored at teardown)."""
+    for name in TRACEBACK_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
 
+
+def test_default_style_is_compact():
     cfg = TracebackConfig.from_environment()
     assert cfg.style == TracebackStyle.COMPACT
     assert cfg.show_locals is False
@@ -23,11 +34,6 @@ def test_default_style_is_compact(monkeypatch):
 
 
 def test_env_sets_full_style(monkeypatch):
-    monkeypatch.delenv("BENGAL_TRACEBACK", raising=False)
-    monkeypatch.delenv("BENGAL_TRACEBACK_SHOW_LOCALS", raising=False)
-    monkeypatch.delenv("BENGAL_TRACEBACK_MAX_FRAMES", raising=False)
-    monkeypatch.delenv("BENGAL_TRACEBACK_SUPPRESS", raising=False)
-
     monkeypatch.setenv("BENGAL_TRACEBACK", "full")
     cfg = TracebackConfig.from_environment()
     assert cfg.style == TracebackStyle.FULL
@@ -35,23 +41,18 @@ def test_env_sets_full_style(monkeypatch):
     assert cfg.max_frames >= 20
 
 
-def test_map_debug_maps_to_full_when_not_overridden(monkeypatch):
-    # monkeypatch.delenv records original state and restores at teardown
-    monkeypatch.delenv("BENGAL_TRACEBACK", raising=False)
+def test_map_debug_maps_to_full_when_not_overridden():
     map_debug_flag_to_traceback(True, None)
     assert os.environ.get("BENGAL_TRACEBACK") == "full"
 
 
-def test_map_debug_does_not_override_explicit_traceback(monkeypatch):
-    monkeypatch.delenv("BENGAL_TRACEBACK", raising=False)
+def test_map_debug_does_not_override_explicit_traceback():
     set_effective_style_from_cli("minimal")
     map_debug_flag_to_traceback(True, "minimal")
     assert os.environ.get("BENGAL_TRACEBACK") == "minimal"
 
 
-def test_get_renderer_types(monkeypatch):
-    monkeypatch.delenv("BENGAL_TRACEBACK", raising=False)
-
+def test_get_renderer_types():
     # Full
     set_effective_style_from_cli("full")
     cfg = TracebackConfig.from_environment()
@@ -81,13 +82,7 @@ def test_get_renderer_types(monkeypatch):
     assert isinstance(cfg.get_renderer(), OffTracebackRenderer)
 
 
-def test_apply_file_traceback_to_env_sets_env(monkeypatch):
-    # monkeypatch.delenv records original state and restores at teardown
-    monkeypatch.delenv("BENGAL_TRACEBACK", raising=False)
-    monkeypatch.delenv("BENGAL_TRACEBACK_SHOW_LOCALS", raising=False)
-    monkeypatch.delenv("BENGAL_TRACEBACK_MAX_FRAMES", raising=False)
-    monkeypatch.delenv("BENGAL_TRACEBACK_SUPPRESS", raising=False)
-
+def test_apply_file_traceback_to_env_sets_env():
     site_cfg = {
         "dev": {
             "traceback": {
@@ -105,3 +100,44 @@ def test_apply_file_traceback_to_env_sets_env(monkeypatch):
     assert os.getenv("BENGAL_TRACEBACK_SHOW_LOCALS") == "1"
     assert os.getenv("BENGAL_TRACEBACK_MAX_FRAMES") == "7"
     assert os.getenv("BENGAL_TRACEBACK_SUPPRESS") == "click,jinja2"
+
+
+def test_from_mapping_matches_file_config():
+    cfg = TracebackConfig.from_mapping(
+        {"style": "minimal", "show_locals": True, "max_frames": 7, "suppress": ["rich"]}
+    )
+    assert cfg.style == TracebackStyle.MINIMAL
+    assert cfg.show_locals is True
+    assert cfg.max_frames == 7
+    assert cfg.suppress == ("rich",)
+
+    # Missing and invalid values fall back to the style defaults
+    cfg = TracebackConfig.from_mapping({"style": "full", "max_frames": "many"})
+    assert cfg.show_locals is True
+    assert cfg.max_frames == 25
+
+
+def test_from_environment_reparses_after_env_change(monkeypatch):
+    cfg = TracebackConfig.from_environment()
+    assert TracebackConfig.from_environment() is cfg
+
+    monkeypatch.setenv("BENGAL_TRACEBACK", "minimal")
+    assert TracebackConfig.from_environment().style == TracebackStyle.MINIMAL
+
+
+def test_get_renderer_reuses_instance_per_config():
+    renderer = TracebackConfig(style=TracebackStyle.MINIMAL).get_renderer()
+
+    assert TracebackConfig(style=TracebackStyle.MINIMAL).get_renderer() is renderer
+    assert (
+        TracebackConfig(style=TracebackStyle.MINIMAL, max_frames=3).get_renderer()
+        is not renderer
+    )
+
+
+def test_shared_config_is_immutable():
+    cfg = TracebackConfig.from_environment()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.max_frames = 1  # type: ignore[misc]
+    assert TracebackConfig.from_environment().max_frames == 10